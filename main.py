@@ -3,6 +3,7 @@ import sys
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from src.frontend.ui.main_window import MainWindow
+from src.frontend.utils.logger import setup_logging
 
 class Application(QApplication):
     def __init__(self, argv):
@@ -13,6 +14,8 @@ class Application(QApplication):
         self.main_window.show()
 
 def main():
+    setup_logging()
+    
     # Enable high DPI support
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
@@ -42,5 +42,8 @@ def get_logger(name: str) -> logging.Logger:
         file_handler.setFormatter(console_formatter)
         file_handler.setLevel(logging.DEBUG)
         logger.addHandler(file_handler)
+        
+        # These handlers already emit everything; don't repeat it via the root logger
+        logger.propagate = False
     
     return logger
\ No newline at end of file
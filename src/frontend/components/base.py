@@ -1,10 +1,15 @@
 # src/frontend/components/base.py
 from PyQt5.QtWidgets import QGraphicsObject, QGraphicsItem
 from PyQt5.QtCore import Qt, QRectF, QPointF, pyqtSignal
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QPainterPath
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QPainterPath, QPixmap, QPixmapCache
 from typing import Dict, Any, List, Optional
+import math
 import uuid
 
+import numpy as np
+
+from src.frontend.utils.logger import get_logger
+
 class Port(QGraphicsItem):
     """Represents an input/output port on a component."""
     def __init__(self, name: str, port_type: str, position: QPointF, is_output: bool = False, parent=None):
@@ -50,10 +55,32 @@ class Port(QGraphicsItem):
                      self.radius * 2, self.radius * 2)
                      
     def paint(self, painter: QPainter, option, widget=None):
-        """Draw the port."""
+        """Draw the port from a cached pixmap."""
+        # Rasterize at device resolution (HiDPI and zoom), rounded to quarter
+        # steps so zooming doesn't fill the cache with near-identical pixmaps
+        scale = painter.device().devicePixelRatioF() * option.levelOfDetailFromTransform(painter.worldTransform())
+        ratio = min(max(1.0, math.ceil(scale * 4) / 4), 8.0)
+        key = f"port_{self.color.name()}_{self.radius}_{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self._render_to_pixmap(ratio)
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(QRectF(-self.radius, -self.radius, self.radius * 2, self.radius * 2),
+                           pixmap, QRectF(pixmap.rect()))
+
+    def _render_to_pixmap(self, ratio: float = 1.0) -> QPixmap:
+        """Rasterize the port ellipse once for the current color and pixel ratio."""
+        size = self.radius * 2
+        pixmap = QPixmap(math.ceil(size * ratio), math.ceil(size * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setPen(Qt.NoPen)
         painter.setBrush(QBrush(self.color))
-        painter.drawEllipse(self.boundingRect())
+        painter.drawEllipse(QRectF(0, 0, size, size))
+        painter.end()
+        return pixmap
         
     def mousePressEvent(self, event):
         """Handle mouse press events."""
@@ -102,8 +129,17 @@ class WorkflowComponent(QGraphicsObject):
     position_changed = pyqtSignal()
     property_changed = pyqtSignal(str, dict)  # Added for property changes
     
+    # True when execute() never touches widgets, so the canvas may run it
+    # on a worker thread alongside independent components
+    thread_safe = False
+    
+    # False when execute() has visible side effects (e.g. showing a plot)
+    # that must happen on every run, so its result is never reused
+    cache_results = True
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.logger = get_logger(self.__class__.__module__)
         
         self.id = str(uuid.uuid4())
         self.title = "Base Component"
@@ -122,6 +158,8 @@ class WorkflowComponent(QGraphicsObject):
         # Component properties
         self.input_ports: Dict[str, Port] = {}
         self.output_ports: Dict[str, Port] = {}
+        # Local (x, y) of every port, indexed by port.offset_index
+        self.port_offsets = np.empty((0, 2))
         self.properties: Dict[str, Any] = {}
         
         # Set flags
@@ -184,6 +222,14 @@ class WorkflowComponent(QGraphicsObject):
         """Get component properties for the property editor."""
         return self.properties
         
+    def cache_key(self) -> Any:
+        """Fingerprint everything besides inputs that determines execute()'s result.
+        
+        Components reading external state (files, URLs) extend this so the
+        canvas re-runs them when that state changes.
+        """
+        return repr(self.get_properties())
+        
     def set_property(self, name: str, value: Any):
         """Set a component property and emit change signal."""
         if name in self.properties:
@@ -243,7 +289,8 @@ class WorkflowComponent(QGraphicsObject):
         
     def itemChange(self, change, value):
         """Handle item changes and emit signals."""
-        if change == QGraphicsObject.ItemPositionChange:
+        if change == QGraphicsObject.ItemPositionHasChanged:
+            # After the move, so listeners reading pos() see the new position
             self.position_changed.emit()
         elif change == QGraphicsObject.ItemSelectedChange:
             if value and hasattr(self.scene(), 'component_selected'):
@@ -260,10 +307,23 @@ class WorkflowComponent(QGraphicsObject):
         position = QPointF(0.0, float(y_position))  # Ensure float values
         port = Port(name, port_type, position, False, self)
         self.input_ports[name] = port
+        self._track_port(port)
         
     def add_output_port(self, name: str, port_type: str, y_position: float):
         """Add an output port to the component."""
         # Create the port at the right side of the component
         position = QPointF(float(self.width), float(y_position))  # Ensure float values
         port = Port(name, port_type, position, True, self)
-        self.output_ports[name] = port
\ No newline at end of file
+        self.output_ports[name] = port
+        self._track_port(port)
+
+    def _track_port(self, port: Port):
+        """Record a port's local offset for bulk scene-position lookups."""
+        port.offset_index = len(self.port_offsets)
+        offset = port.pos()
+        self.port_offsets = np.vstack((self.port_offsets, (offset.x(), offset.y())))
+
+    def port_scene_xy(self) -> np.ndarray:
+        """Scene coordinates of all ports as an (num_ports, 2) array."""
+        pos = self.pos()
+        return self.port_offsets + (pos.x(), pos.y())
\ No newline at end of file
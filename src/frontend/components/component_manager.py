@@ -1,13 +1,4 @@
-class ComponentManager:
-    def __init__(self):
-        self.components = {}
-        
-    def register_component(self, component_class):
-        """Register a new component type."""
-        self.components[component_class.__name__] = component_class
-        
-    def create_component(self, component_type):
-        """Create a new component instance."""
-        if component_type in self.components:
-            return self.components[component_type]()
-        return None
\ No newline at end of file
+# src/frontend/components/component_manager.py
+from ..core.component_manager import ComponentManager
+
+__all__ = ["ComponentManager"]
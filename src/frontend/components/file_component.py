@@ -1,15 +1,20 @@
 from .base import WorkflowComponent
-from PyQt5.QtCore import QPointF, Qt
+from PyQt5.QtCore import QPointF, Qt, QThread
 from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
-from PyQt5.QtWidgets import QFileDialog , QMessageBox
+from PyQt5.QtWidgets import QApplication, QFileDialog , QMessageBox
 import pandas as pd
-import json
-from typing import Dict, Any
+import logging
+import os
+from typing import Dict, Any, Optional
 
 
 class FileComponent(WorkflowComponent):
     """Component for handling file input with support for multiple file types."""
     
+    # Reading files only touches pandas (dialogs are skipped off the GUI
+    # thread), so independent readers run in parallel
+    thread_safe = True
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.title = "File Input"
@@ -52,54 +57,79 @@ class FileComponent(WorkflowComponent):
                     "choices": [",", ";", "\t", "|"]
                 },
                 "description": "Column separator character"
+            },
+            "json_orient": {
+                "type": "choice",
+                "label": "JSON Orient",
+                "value": {
+                    "selected": "records",
+                    "choices": ["records", "columns", "split", "index", "values"]
+                },
+                "description": "Layout of JSON input data"
             }
         }
         
         self._cached_data = None
+        self._cached_options = None
 
-    # In file_component.py
     def process(self, inputs=None):
-        """Process the file input."""
-        try:
-            file_path = self.properties["file_path"]["value"]
-            if not file_path:
-                return None
-                
-            # Read file based on type
-            file_type = self.properties["file_type"]["value"]["selected"]
-            if file_type == "csv":
-                return pd.read_csv(file_path)
-            elif file_type == "excel":
-                return pd.read_excel(file_path)
-            # ... handle other file types ...
-            
-        except Exception as e:
-            self.logger.error(f"Failed to process file: {str(e)}")
+        """Process the file input, reusing the last read when nothing changed."""
+        if not self.properties["file_path"]["value"]:
             return None
+        if self._cached_data is not None and self._cached_options == self._read_options():
+            return self._cached_data
+        return self.execute(inputs).get("output")
 
-    def get_output(self):
-        """Return the processed data."""
-        return self.process()  
+    get_output = process
+
+    @staticmethod
+    def _on_gui_thread() -> bool:
+        """Whether dialogs may be shown from the current thread."""
+        app = QApplication.instance()
+        return app is not None and QThread.currentThread() == app.thread()
+
+    def _read_options(self) -> tuple:
+        """Return the property values and file state that determine what gets read."""
+        return (
+            self.properties["file_path"]["value"],
+            self._file_stamp(),
+            self.properties["file_type"]["value"]["selected"],
+            self.properties["has_header"]["value"],
+            self.properties["delimiter"]["value"]["selected"],
+            self.properties.get("json_orient", {}).get("value", {}).get("selected", "records"),
+        )
+
+    def cache_key(self) -> Any:
+        """Include the file's state so edits on disk invalidate cached results."""
+        return super().cache_key(), self._file_stamp()
+
+    def _file_stamp(self) -> Optional[tuple]:
+        """Return the input file's (mtime_ns, size), or None if it can't be stat'ed."""
+        try:
+            st = os.stat(self.properties["file_path"]["value"])
+        except (OSError, ValueError):
+            return None
+        return st.st_mtime_ns, st.st_size
 
-        
     def execute(self, inputs: Dict[str, Any] = None) -> Dict[str, Any]:
         """Execute file reading operation."""
         try:
             file_path = self.properties["file_path"]["value"]
             if not file_path:
-                # Show UI warning when no file is selected
-                QMessageBox.warning(
-                    None,
-                    "Input Required",
-                    "Please add data to File Component before making connections.\n\nSteps:\n1. Select File Component\n2. Click 'Browse' in Properties panel\n3. Choose your data file\n4. And re-establish connection",
-                    QMessageBox.Ok
-                )
+                # Show UI warning when no file is selected (GUI thread only)
+                if self._on_gui_thread():
+                    QMessageBox.warning(
+                        None,
+                        "Input Required",
+                        "Please add data to File Component before making connections.\n\nSteps:\n1. Select File Component\n2. Click 'Browse' in Properties panel\n3. Choose your data file\n4. And re-establish connection",
+                        QMessageBox.Ok
+                    )
                 return {
                     "status": "error",
                     "error": "No file selected"
                 }
                 
-            print(f"FileComponent: Reading file from {file_path}")
+            self.logger.debug("FileComponent: Reading file from %s", file_path)
             file_type = self.properties["file_type"]["value"]["selected"]
             has_header = self.properties["has_header"]["value"]
             delimiter = self.properties["delimiter"]["value"]["selected"]
@@ -118,15 +148,20 @@ class FileComponent(WorkflowComponent):
                         header=0 if has_header else None
                     )
                 elif file_type == "json":
-                    with open(file_path, 'r') as f:
-                        data = pd.DataFrame(json.load(f))
+                    json_orient = self.properties.get("json_orient", {}).get("value", {})
+                    data = pd.read_json(
+                        file_path,
+                        orient=json_orient.get("selected", "records")
+                    )
                 else:
                     with open(file_path, 'r') as f:
                         data = pd.DataFrame([line.strip().split(delimiter) for line in f])
                         
                 self._cached_data = data
-                print(f"FileComponent: Successfully read data with shape: {data.shape}")
-                print(f"FileComponent: Columns: {data.columns.tolist()}")
+                self._cached_options = self._read_options()
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("FileComponent: Successfully read data with shape: %s", data.shape)
+                    self.logger.debug("FileComponent: Columns: %s", data.columns.tolist())
                 
                 return {
                     "output": data,
@@ -139,19 +174,21 @@ class FileComponent(WorkflowComponent):
                 }
                 
             except Exception as e:
-                QMessageBox.critical(
-                    None,
-                    "File Error",
-                    f"Error reading file:\n{str(e)}",
-                    QMessageBox.Ok
-                )
+                # Off the GUI thread the canvas reports the returned error instead
+                if self._on_gui_thread():
+                    QMessageBox.critical(
+                        None,
+                        "File Error",
+                        f"Error reading file:\n{str(e)}",
+                        QMessageBox.Ok
+                    )
                 return {
                     "status": "error",
                     "error": str(e)
                 }
                 
         except Exception as e:
-            print(f"FileComponent ERROR: {str(e)}")
+            self.logger.error("FileComponent ERROR: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
@@ -32,6 +32,9 @@ class PlotWindow(QDialog):
         self.setLayout(layout)
 
 class GraphComponent(WorkflowComponent):
+    # Every run must show its plot
+    cache_results = False
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.title = "Graph Output"
@@ -82,7 +85,7 @@ class GraphComponent(WorkflowComponent):
         }
 
     def execute(self, inputs: Dict[str, Any] = None) -> Dict[str, Any]:
-        print("GraphComponent: Execute called")
+        self.logger.debug("GraphComponent: Execute called")
         try:
             if not inputs or 'input' not in inputs:
                 QMessageBox.warning(
@@ -94,14 +97,14 @@ class GraphComponent(WorkflowComponent):
                 return {"status": "error", "error": "No input data"}
 
             self._current_data = inputs['input']
-            print(f"GraphComponent: Received input type: {type(self._current_data)}")
+            self.logger.debug("GraphComponent: Received input type: %s", type(self._current_data))
 
             # Create and show plot window
             self._create_plot(self._current_data)
             return {"status": "success"}
 
         except Exception as e:
-            print(f"GraphComponent ERROR: {str(e)}")
+            self.logger.error("GraphComponent ERROR: %s", e)
             return {"status": "error", "error": str(e)}
 
 
@@ -111,12 +114,12 @@ class GraphComponent(WorkflowComponent):
         
         # If changing graph type and we have data, update the plot
         if name == "graph_type" and self._current_data is not None:
-            print(f"GraphComponent: Updating visualization to {value}")
+            self.logger.debug("GraphComponent: Updating visualization to %s", value)
             self._create_plot(self._current_data)
 
     def _create_plot(self, data):
         try:
-            print("GraphComponent: Creating plot...")
+            self.logger.debug("GraphComponent: Creating plot...")
             
             # Create plot window if it doesn't exist
             if not self.plot_window:
@@ -183,7 +186,7 @@ class GraphComponent(WorkflowComponent):
                     data["predictions"] is not None and data["true_labels"] is not None):
                     from sklearn.metrics import confusion_matrix
                     import seaborn as sns
-                    print("GraphComponent: Creating confusion matrix")
+                    self.logger.debug("GraphComponent: Creating confusion matrix")
                     cm = confusion_matrix(data["true_labels"], data["predictions"])
                     sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax)
                     ax.set_title('Confusion Matrix')
@@ -196,10 +199,10 @@ class GraphComponent(WorkflowComponent):
             self.plot_window.canvas.draw()
             self.plot_window.show()
             self.plot_window.raise_()
-            print("GraphComponent: Plot updated successfully")
+            self.logger.debug("GraphComponent: Plot updated successfully")
 
         except Exception as e:
-            print(f"GraphComponent ERROR in _create_plot: {str(e)}")
+            self.logger.error("GraphComponent ERROR in _create_plot: %s", e)
             QMessageBox.critical(
                 None,
                 "Visualization Error",
@@ -217,7 +220,7 @@ class GraphComponent(WorkflowComponent):
 
     def set_property(self, name: str, value: Any):
         """Handle property changes and update plot."""
-        print(f"GraphComponent: Setting property {name} to {value}")
+        self.logger.debug("GraphComponent: Setting property %s to %s", name, value)
         super().set_property(name, value)
         if self._current_data is not None:
             self._create_plot(self._current_data)
\ No newline at end of file
@@ -0,0 +1,136 @@
+# src/frontend/tests/test_canvas.py
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PyQt5")
+canvas_module = pytest.importorskip("src.frontend.ui.canvas")
+
+from PyQt5.QtGui import QPainterPath
+
+WorkflowCanvas = canvas_module.WorkflowCanvas
+has_cycle_csr = canvas_module.has_cycle_csr
+build_connection_paths = canvas_module.build_connection_paths
+
+
+def _csr(n, edges):
+    """Build (indptr, indices) for n nodes from (source, target) pairs."""
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    for source, _ in edges:
+        indptr[source + 1] += 1
+    np.cumsum(indptr, out=indptr)
+    indices = np.array([t for _, t in sorted(edges, key=lambda e: e[0])], dtype=np.int64)
+    return indptr, indices
+
+
+@pytest.mark.parametrize("n, edges, expected", [
+    (0, [], False),
+    (3, [], False),
+    (3, [(0, 1), (1, 2)], False),
+    (4, [(0, 1), (0, 2), (1, 3), (2, 3)], False),  # diamond
+    (1, [(0, 0)], True),  # self loop
+    (3, [(0, 1), (1, 2), (2, 0)], True),
+    (5, [(0, 1), (2, 3), (3, 4), (4, 2)], True),  # cycle in a later component
+])
+def test_has_cycle_csr(n, edges, expected):
+    assert bool(has_cycle_csr(*_csr(n, edges))) is expected
+
+
+def test_has_cycle_csr_handles_deep_chains():
+    n = 5000
+    chain = [(i, i + 1) for i in range(n - 1)]
+    assert not has_cycle_csr(*_csr(n, chain))
+    assert has_cycle_csr(*_csr(n, chain + [(n - 1, 0)]))
+
+
+def _fake_graph(component_ids, edges):
+    """Stand-in exposing the attributes _build_csr reads."""
+    def port(comp_id):
+        owner = SimpleNamespace(id=comp_id)
+        return SimpleNamespace(parent=lambda: owner)
+
+    return SimpleNamespace(
+        components={comp_id: None for comp_id in component_ids},
+        connections=[SimpleNamespace(start_port=port(s), end_port=port(t)) for s, t in edges])
+
+
+def test_build_csr_matches_connections():
+    graph = _fake_graph(["a", "b", "c"], [("b", "c"), ("a", "b"), ("a", "c")])
+    indptr, indices = WorkflowCanvas._build_csr(graph)
+
+    assert indptr.tolist() == [0, 2, 3, 3]
+    assert sorted(indices[indptr[0]:indptr[1]].tolist()) == [1, 2]
+    assert indices[indptr[1]:indptr[2]].tolist() == [2]
+    assert not has_cycle_csr(indptr, indices)
+
+
+def test_build_csr_detects_cycle_through_connections():
+    graph = _fake_graph(["a", "b"], [("a", "b"), ("b", "a")])
+    assert has_cycle_csr(*WorkflowCanvas._build_csr(graph))
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0, 0), (7, 0), (8, 16), (15.9, 16), (24, 32), (-7, 0), (-9, -16),
+])
+def test_snap_rounds_to_grid(value, expected):
+    assert WorkflowCanvas._snap(value) == expected
+
+
+def test_build_connection_paths_matches_cubic_curve():
+    starts = np.array([[0.0, 0.0], [10.0, 5.0]])
+    ends = np.array([[100.0, 50.0], [1000.0, -5.0]])
+    paths = build_connection_paths(starts, ends)
+
+    assert len(paths) == 2
+    for path, (sx, sy), (ex, ey) in zip(paths, starts, ends):
+        control = min(abs(ex - sx) * 0.5, 200.0)
+        expected = QPainterPath()
+        expected.moveTo(sx, sy)
+        expected.cubicTo(sx + control, sy, ex - control, ey, ex, ey)
+        assert path == expected
+
+
+def test_build_connection_paths_empty():
+    assert build_connection_paths(np.empty((0, 2)), np.empty((0, 2))) == []
+
+
+def test_workflow_file_round_trip(tmp_path):
+    filename = str(tmp_path / "flow.workflow")
+    data = {
+        "components": {
+            "c1": {"type": "FileComponent", "position": {"x": 16.0, "y": 32.0},
+                   "properties": {"file_path": {"value": "data.csv"}}},
+            "c2": {"type": "GraphComponent", "position": {"x": 200.0, "y": 32.0},
+                   "properties": {}},
+        },
+        "connections": [
+            {"start": {"component": "c1", "port": "output"},
+             "end": {"component": "c2", "port": "input"}},
+        ],
+    }
+    components = [(canvas_module._dump_json(comp_id), canvas_module._dump_json(entry))
+                  for comp_id, entry in data["components"].items()]
+    connections = [canvas_module._dump_json(entry) for entry in data["connections"]]
+
+    WorkflowCanvas.write_workflow_file(filename, components, connections)
+
+    assert WorkflowCanvas.read_workflow_file(filename) == data
+    assert [p.name for p in tmp_path.iterdir()] == ["flow.workflow"]
+
+
+def test_workflow_file_round_trip_empty(tmp_path):
+    filename = str(tmp_path / "empty.workflow")
+    WorkflowCanvas.write_workflow_file(filename, [], [])
+    assert WorkflowCanvas.read_workflow_file(filename) == {"components": {}, "connections": []}
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    filename = tmp_path / "flow.workflow"
+    filename.write_text("previous")
+
+    with pytest.raises(TypeError):
+        WorkflowCanvas.write_workflow_file(str(filename), [(b'"c1"', None)], [])
+
+    assert filename.read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["flow.workflow"]
@@ -0,0 +1,117 @@
+# src/frontend/tests/test_config.py
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import QCoreApplication
+
+import src.frontend.utils.config as config_module
+from src.frontend.utils.config import ConfigManager
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(ConfigManager, "_CACHE", {})
+
+
+@pytest.fixture
+def no_app(monkeypatch):
+    """Make ConfigManager behave as if no Qt application is running."""
+    monkeypatch.setattr(config_module, "QCoreApplication", SimpleNamespace(instance=lambda: None))
+
+
+@pytest.fixture
+def qapp():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data))
+
+
+def test_missing_file_gives_defaults(tmp_path, no_app):
+    config = ConfigManager(str(tmp_path / "config.json"))
+    assert config.get("theme") == "light"
+    assert ConfigManager._CACHE == {}
+
+
+def test_unchanged_file_is_served_from_cache(tmp_path, no_app, monkeypatch):
+    path = tmp_path / "config.json"
+    _write(path, {"theme": "dark", "ui": {"show_grid": False}})
+    first = ConfigManager(str(path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("config was parsed again")
+    monkeypatch.setattr(config_module.json, "load", fail)
+
+    second = ConfigManager(str(path))
+    assert second.config == first.config == {"theme": "dark", "ui": {"show_grid": False}}
+
+
+def test_instances_do_not_share_nested_state(tmp_path, no_app):
+    path = tmp_path / "config.json"
+    _write(path, {"ui": {"show_grid": False}})
+    first = ConfigManager(str(path))
+    first.config["ui"]["show_grid"] = True
+
+    assert ConfigManager(str(path)).get("ui") == {"show_grid": False}
+
+
+def test_modified_file_is_parsed_again(tmp_path, no_app):
+    path = tmp_path / "config.json"
+    _write(path, {"theme": "dark"})
+    ConfigManager(str(path))
+
+    _write(path, {"theme": "light"})
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert ConfigManager(str(path)).get("theme") == "light"
+
+
+def test_set_writes_through_without_an_app(tmp_path, no_app):
+    path = tmp_path / "config.json"
+    config = ConfigManager(str(path))
+
+    config.set("theme", "dark")
+
+    assert json.loads(path.read_text())["theme"] == "dark"
+    assert not config._dirty
+
+
+def test_save_refreshes_cache(tmp_path, no_app, monkeypatch):
+    path = tmp_path / "config.json"
+    config = ConfigManager(str(path))
+    config.set("theme", "dark")
+    config.config["theme"] = "edited after save"
+
+    monkeypatch.setattr(config_module.json, "load", None)
+    assert ConfigManager(str(path)).get("theme") == "dark"
+
+
+def test_set_is_debounced_with_an_app(tmp_path, qapp):
+    path = tmp_path / "config.json"
+    config = ConfigManager(str(path))
+
+    config.set("theme", "dark")
+    config.set("grid_size", 32)
+    assert not path.exists()
+    assert config._flush_timer.isActive()
+
+    assert config.flush()
+    assert not config._flush_timer.isActive()
+    saved = json.loads(path.read_text())
+    assert (saved["theme"], saved["grid_size"]) == ("dark", 32)
+
+
+def test_set_with_same_value_does_not_schedule_a_write(tmp_path, qapp):
+    config = ConfigManager(str(tmp_path / "config.json"))
+
+    config.set("theme", config.get("theme"))
+
+    assert not config._dirty
+    assert not config._flush_timer.isActive()
@@ -0,0 +1,117 @@
+# src/frontend/tests/test_undo_commands.py
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import QPointF
+
+from src.frontend.ui.undo_commands import (AddComponentCmd, RemoveComponentCmd, AddConnectionCmd,
+                                           RemoveConnectionCmd, MoveComponentCmd, MacroCmd)
+
+
+class FakeCanvas:
+    """Records the canvas calls undo commands make."""
+
+    def __init__(self):
+        self.components = set()
+        self.connections = set()
+        self.calls = []
+
+    def add_component(self, component, save_state=True):
+        self.calls.append(("add_component", component))
+        self.components.add(component)
+
+    def remove_component(self, component):
+        self.calls.append(("remove_component", component))
+        self.components.discard(component)
+
+    def attach_connection(self, connection):
+        self.calls.append(("attach_connection", connection))
+        self.connections.add(connection)
+
+    def remove_connection(self, connection):
+        self.calls.append(("remove_connection", connection))
+        self.connections.discard(connection)
+
+
+class FakeComponent:
+    def __init__(self, pos):
+        self._pos = pos
+
+    def setPos(self, pos):
+        self._pos = pos
+
+    def pos(self):
+        return self._pos
+
+
+def test_add_component_round_trip():
+    canvas, component = FakeCanvas(), object()
+    command = AddComponentCmd(component)
+
+    command.do(canvas)
+    assert canvas.components == {component}
+    command.undo(canvas)
+    assert canvas.components == set()
+    command.do(canvas)
+    assert canvas.components == {component}
+
+
+def test_remove_component_restores_its_connections():
+    canvas, component = FakeCanvas(), object()
+    connections = [object(), object()]
+    canvas.components.add(component)
+    canvas.connections.update(connections)
+    command = RemoveComponentCmd(component, connections)
+
+    command.do(canvas)
+    canvas.connections.difference_update(connections)  # the canvas drops them with the component
+    assert canvas.components == set()
+
+    command.undo(canvas)
+    assert canvas.components == {component}
+    assert canvas.connections == set(connections)
+    # The component must be back before its connections are re-attached
+    assert canvas.calls[1] == ("add_component", component)
+
+
+def test_connection_commands_are_inverses():
+    canvas, connection = FakeCanvas(), object()
+
+    add = AddConnectionCmd(connection)
+    add.do(canvas)
+    assert canvas.connections == {connection}
+    add.undo(canvas)
+    assert canvas.connections == set()
+
+    canvas.connections.add(connection)
+    remove = RemoveConnectionCmd(connection)
+    remove.do(canvas)
+    assert canvas.connections == set()
+    remove.undo(canvas)
+    assert canvas.connections == {connection}
+
+
+def test_move_component_round_trip():
+    old_pos, new_pos = QPointF(0, 0), QPointF(32, 48)
+    component = FakeComponent(new_pos)
+    command = MoveComponentCmd(component, old_pos, new_pos)
+
+    command.undo(FakeCanvas())
+    assert component.pos() == old_pos
+    command.do(FakeCanvas())
+    assert component.pos() == new_pos
+
+
+def test_macro_undoes_in_reverse_order():
+    canvas = FakeCanvas()
+    first, second = object(), object()
+    macro = MacroCmd([AddComponentCmd(first), AddComponentCmd(second)])
+
+    macro.do(canvas)
+    assert canvas.components == {first, second}
+    canvas.calls.clear()
+
+    macro.undo(canvas)
+    assert canvas.calls == [("remove_component", second), ("remove_component", first)]
+    assert canvas.components == set()
@@ -1,15 +1,25 @@
 # src/frontend/ui/canvas.py
 from PyQt5.QtWidgets import (QGraphicsView, QGraphicsScene, QMenu, 
-                           QGraphicsPathItem, QProgressDialog, QMessageBox , QGraphicsItem)
-from PyQt5.QtCore import Qt, QPointF, QRectF, pyqtSignal, QMimeData
+                           QGraphicsPathItem, QProgressDialog, QMessageBox , QGraphicsItem,
+                           QOpenGLWidget, QApplication)
+from PyQt5.QtCore import Qt, QPointF, QRectF, QLineF, pyqtSignal, QMimeData, QByteArray, QDataStream, QTimer
 from PyQt5.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath, QLinearGradient
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
+from collections import OrderedDict, defaultdict, deque
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, wait
 import logging
 import json
+import math
+import os
+import struct
+import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
-from numpy import e
+import numpy as np
 
 from src.frontend.components.cnn_component import CNNComponent
 from src.frontend.components.file_component import FileComponent
@@ -18,65 +28,209 @@ from src.backend.core.workflow_engine import WorkflowEngine
 from src.frontend.components.base import WorkflowComponent, Port
 from src.core.component_bridge import ComponentBridge
 from src.frontend.utils.logger import get_logger
+from .undo_commands import (AddComponentCmd, RemoveComponentCmd, AddConnectionCmd,
+                            RemoveConnectionCmd, MoveComponentCmd, MacroCmd)
+
+_COMPONENT_REGISTRY: Dict[str, type] = {
+    "FileComponent": FileComponent,
+    "GraphComponent": GraphComponent,
+    "CNNComponent": CNNComponent,
+}
+
+# QPainterPath stream layout: big-endian element count, then one
+# (type, x, y) record per element, then the cStart and fill rule ints.
+_PATH_ELEMENT = np.dtype([('type', '>i4'), ('x', '>f8'), ('y', '>f8')])
+_CUBIC_ELEMENT_TYPES = np.array([QPainterPath.MoveToElement,
+                                 QPainterPath.CurveToElement,
+                                 QPainterPath.CurveToDataElement,
+                                 QPainterPath.CurveToDataElement], dtype='>i4')
+_CUBIC_PATH_HEADER = struct.pack('>i', len(_CUBIC_ELEMENT_TYPES))
+_CUBIC_PATH_FOOTER = struct.pack('>ii', 0, int(Qt.OddEvenFill))
+
+
+def build_connection_paths(starts: np.ndarray, ends: np.ndarray) -> List[QPainterPath]:
+    """Build connection curves for many edges at once.
+    
+    Args:
+        starts: (N, 2) array of start points in scene coordinates
+        ends: (N, 2) array of end points in scene coordinates
+        
+    Returns:
+        One cubic QPainterPath per edge, shaped like ConnectionLine.update_position
+    """
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    control_distance = np.minimum(np.abs(ends[:, 0] - starts[:, 0]) * 0.5, 200.0)
+    
+    points = np.empty((len(starts), 4, 2), dtype=np.float64)
+    points[:, 0] = starts
+    points[:, 1, 0] = starts[:, 0] + control_distance
+    points[:, 1, 1] = starts[:, 1]
+    points[:, 2, 0] = ends[:, 0] - control_distance
+    points[:, 2, 1] = ends[:, 1]
+    points[:, 3] = ends
+    
+    records = np.empty((len(starts), 4), dtype=_PATH_ELEMENT)
+    records['type'] = _CUBIC_ELEMENT_TYPES
+    records['x'] = points[..., 0]
+    records['y'] = points[..., 1]
+    
+    paths = []
+    for row in records:
+        path = QPainterPath()
+        QDataStream(QByteArray(_CUBIC_PATH_HEADER + row.tobytes() + _CUBIC_PATH_FOOTER)) >> path
+        paths.append(path)
+    return paths
+
+
+def has_cycle_csr(indptr: np.ndarray, indices: np.ndarray) -> bool:
+    """Detect a cycle in a directed graph given in CSR form.
+    
+    Iterative three-colour DFS (0=unvisited, 1=on stack, 2=done), so deep
+    graphs cannot hit the recursion limit.
+    """
+    n = indptr.shape[0] - 1
+    color = np.zeros(n, np.uint8)
+    stack = np.empty(n, np.int64)
+    cursor = indptr[:-1].copy()
+    
+    for root in range(n):
+        if color[root] != 0:
+            continue
+        top = 0
+        stack[0] = root
+        color[root] = 1
+        while top >= 0:
+            node = stack[top]
+            if cursor[node] < indptr[node + 1]:
+                neighbour = indices[cursor[node]]
+                cursor[node] += 1
+                if color[neighbour] == 1:
+                    return True
+                if color[neighbour] == 0:
+                    color[neighbour] = 1
+                    top += 1
+                    stack[top] = neighbour
+            else:
+                color[node] = 2
+                top -= 1
+    return False
+
+
+try:
+    from numba import njit
+    has_cycle_csr = njit(cache=True)(has_cycle_csr)
+except ImportError:
+    # numba is optional; the pure-Python loop is fine for small graphs
+    pass
+
+
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    _load_json = orjson.loads
+except ImportError:
+    # orjson is optional; the stdlib encoder needs numpy values converted
+    def _numpy_default(obj):
+        """Convert numpy scalars and arrays the stdlib encoder rejects."""
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dump_json(obj) -> bytes:
+        """Encode an object as compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':'), default=_numpy_default).encode('utf-8')
+
+    _load_json = json.loads
+
+
+def _connection_pen(color: QColor, width: int) -> QPen:
+    """Create a round-capped connection pen."""
+    pen = QPen(color, width, Qt.SolidLine)
+    pen.setCapStyle(Qt.RoundCap)
+    pen.setJoinStyle(Qt.RoundJoin)
+    return pen
+
 
 class ConnectionLine(QGraphicsPathItem):
     """Enhanced connection line with visual feedback and validation."""
     
+    # Colors for different states
+    default_color = QColor("#94a3b8")
+    hover_color = QColor("#3b82f6")
+    selected_color = QColor("#60a5fa")
+    active_color = QColor("#4ade80")
+    error_color = QColor("#ef4444")
+    
+    # One pen per state, shared by every connection
+    _pen_default = _connection_pen(default_color, 2)
+    _pen_hover = _connection_pen(hover_color, 2)
+    _pen_selected = _connection_pen(selected_color, 3)
+    
     def __init__(self, start_port: Port, end_port: Optional[Port] = None, parent=None):
         super().__init__(parent)
         self.start_port = start_port
         self.end_port = end_port
         self.setZValue(-1)
         
-        # Visual properties
-        self.pen = QPen(QColor("#94a3b8"), 2, Qt.SolidLine)
-        self.pen.setCapStyle(Qt.RoundCap)
-        self.pen.setJoinStyle(Qt.RoundJoin)
-        self.setPen(self.pen)
-        
-        # State colors
-        self.default_color = QColor("#94a3b8")
-        self.hover_color = QColor("#3b82f6")
-        self.active_color = QColor("#4ade80")
-        self.error_color = QColor("#ef4444")
-        
-        self.setAcceptHoverEvents(True)
-        self.hovered = False
-
-        self.start_port = start_port
-        self.end_port = end_port
-        self.setZValue(-1)
-        
         # Make connection selectable
         self.setFlag(QGraphicsItem.ItemIsSelectable)
         self.setAcceptHoverEvents(True)
+        self.hovered = False
         
-        # Visual properties
-        self.pen = QPen(QColor("#94a3b8"), 2, Qt.SolidLine)
-        self.pen.setCapStyle(Qt.RoundCap)
-        self.pen.setJoinStyle(Qt.RoundJoin)
+        # Last (sx, sy, ex, ey) the path was built for
+        self._endpoints: Optional[tuple] = None
+        
+        self.pen = self._pen_default
         self.setPen(self.pen)
         
-        # Colors for different states
-        self.default_color = QColor("#94a3b8")
-        self.hover_color = QColor("#3b82f6")
-        self.selected_color = QColor("#60a5fa")
+        # Rasterize the stroke once and blit it until the path or state changes
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def boundingRect(self) -> QRectF:
+        """Tight bounds from the path's control points, padded by the pen width."""
+        pen_width = self.pen.widthF()
+        return self.path().controlPointRect().adjusted(-pen_width, -pen_width,
+                                                       pen_width, pen_width)
 
     def paint(self, painter: QPainter, option, widget=None):
         """Paint the connection with visual feedback for selection."""
-        if self.isSelected():
-            self.pen.setColor(self.selected_color)
-            self.pen.setWidth(3)
-        elif self.hovered:
-            self.pen.setColor(self.hover_color)
-            self.pen.setWidth(2)
-        else:
-            self.pen.setColor(self.default_color)
-            self.pen.setWidth(2)
-            
         painter.setPen(self.pen)
         painter.drawPath(self.path())
 
+    def _update_pen(self):
+        """Switch to the pen for the current selection/hover state."""
+        pen = (self._pen_selected if self.isSelected()
+               else self._pen_hover if self.hovered
+               else self._pen_default)
+        if pen is not self.pen:
+            self.pen = pen
+            self.setPen(pen)
+
+    def itemChange(self, change, value):
+        """Restyle the connection when its selection state changes."""
+        if change == QGraphicsItem.ItemSelectedHasChanged:
+            self._update_pen()
+        return super().itemChange(change, value)
+
+    def hoverEnterEvent(self, event):
+        """Highlight the connection on hover."""
+        self.hovered = True
+        self._update_pen()
+        super().hoverEnterEvent(event)
+
+    def hoverLeaveEvent(self, event):
+        """Remove the hover highlight."""
+        self.hovered = False
+        self._update_pen()
+        super().hoverLeaveEvent(event)
+
     def mousePressEvent(self, event):
         """Handle mouse press events for selection."""
         if event.button() == Qt.LeftButton:
@@ -85,71 +239,60 @@ class ConnectionLine(QGraphicsPathItem):
         else:
             super().mousePressEvent(event)
 
-    def execute_workflow(self):
-        """Execute the workflow and update visualizations."""
-        try:
-            # Get ordered components
-            ordered_components = self._get_execution_order()
-            
-            # Execute each component in order
-            for component in ordered_components:
-                # Get input data from connected components
-                input_data = {}
-                for conn in self.connections:
-                    if conn.end_port.parent() == component:
-                        source_component = conn.start_port.parent()
-                        source_data = source_component.get_output()
-                        input_data[conn.end_port.name] = source_data
-                
-                # Process component
-                if isinstance(component, GraphComponent):
-                    component.process_data(input_data.get("input"))
-                else:
-                    component.process(input_data)
-                    
-        except Exception as e:
-            self.logger.error(f"Failed to execute workflow: {str(e)}")
-
     def update_position(self, end_point: Optional[QPointF] = None):
         """Update the connection line position with smooth curves."""
         if not self.start_port:
             return
 
-        path = QPainterPath()
         start_pos = self.start_port.scenePos()
         end_pos = end_point if end_point else (self.end_port.scenePos() if self.end_port else start_pos)
+        self.update_position_xy(start_pos.x(), start_pos.y(), end_pos.x(), end_pos.y())
 
-        # Calculate smooth curve control points
-        dx = end_pos.x() - start_pos.x()
-        dy = end_pos.y() - start_pos.y()
-        
-        control_distance = min(abs(dx) * 0.5, 200)
+    def update_position_xy(self, sx: float, sy: float, ex: float, ey: float):
+        """Update the curve from precomputed scene coordinates."""
+        endpoints = (sx, sy, ex, ey)
+        if endpoints == self._endpoints:
+            return
+        self._endpoints = endpoints
         
-        control1 = QPointF(start_pos.x() + control_distance, start_pos.y())
-        control2 = QPointF(end_pos.x() - control_distance, end_pos.y())
+        # Calculate smooth curve control points
+        control_distance = min(abs(ex - sx) * 0.5, 200.0)
 
-        path.moveTo(start_pos)
-        path.cubicTo(control1, control2, end_pos)
+        path = QPainterPath()
+        path.moveTo(sx, sy)
+        path.cubicTo(sx + control_distance, sy, ex - control_distance, ey, ex, ey)
+        self.prepareGeometryChange()
         self.setPath(path)
 
 class WorkflowCanvas(QGraphicsView):
     """Enhanced canvas for workflow management with drag-and-drop support."""
     
+    # Must be a power of two so _snap can round with a bitmask
+    GRID_SIZE = 16
+    
+    # Minimum seconds between execution progress repaints (~60 fps)
+    PROGRESS_INTERVAL = 1 / 60
+    
+    # Most component results kept for reuse across runs; each entry holds
+    # the full result (DataFrames, trained models), so this bounds memory
+    RESULT_CACHE_SIZE = 16
+    
     component_selected = pyqtSignal(WorkflowComponent)
     connection_created = pyqtSignal(object)
     status_message = pyqtSignal(str)
     modified_changed = pyqtSignal(bool)
+    cleared = pyqtSignal()  # Emitted before the scene's items are deleted
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, use_opengl: bool = False):
         super().__init__(parent)
         self.logger = get_logger(__name__)
-        self.component_bridge = ComponentBridge()
+        self.use_opengl = use_opengl
         # Initialize core components
         self.scene = QGraphicsScene(self)
+        # Workflows hold tens of items, and dragging reshapes every attached
+        # connection; a linear scan beats re-balancing a BSP tree per move
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
-        self.workflow_engine = WorkflowEngine()
-        self.component_bridge = ComponentBridge()
-        self._modified = False
         
         # Setup view properties
         self._setup_view_properties()
@@ -160,15 +303,16 @@ class WorkflowCanvas(QGraphicsView):
         
         # Setup undo/redo system
         self._setup_undo_redo()
-        self.current_connection = None
 
-        
-        # Draw grid
-        self._draw_grid()
-        self.undo_stack = []
-        self.redo_stack = []
-        self.max_undo_steps = 50
-        self._modified = False
+    @cached_property
+    def component_bridge(self) -> ComponentBridge:
+        """Bridge to backend components, built on first use."""
+        return ComponentBridge()
+
+    @cached_property
+    def workflow_engine(self) -> WorkflowEngine:
+        """Backend workflow engine, built on first use."""
+        return WorkflowEngine()
 
     @property
     def modified(self) -> bool:
@@ -183,26 +327,29 @@ class WorkflowCanvas(QGraphicsView):
             self.modified_changed.emit(value)
 
 
-    def keyPressEvent(self, event):
-        """Handle keyboard shortcuts."""
-        if event.key() == Qt.Key_Delete:
-            self.delete_selected_items()
-        else:
-            super().keyPressEvent(event)
-
-
     def add_connection(self, connection):
         """Add a connection and trigger data flow."""
-        print("Canvas: Adding connection...")
-        self.connections.add(connection)
+        self.logger.debug("Adding connection")
+        self._register_connection(connection)
+        self._request_update()
+        
+        # Run the data flow after the drop has been handled so the new
+        # connection is drawn first. Component execute() creates dialogs, so
+        # it has to stay on the GUI thread rather than a worker.
+        QTimer.singleShot(0, lambda: self._run_connection_flow(connection))
+
+    def _run_connection_flow(self, connection):
+        """Push data from a newly connected source into its target."""
+        if connection not in self.connections:
+            return
         source_comp = connection.start_port.parent()
         target_comp = connection.end_port.parent()
         
         try:
             if isinstance(source_comp, CNNComponent) and isinstance(target_comp, GraphComponent):
-                print("Canvas: CNN -> Graph connection detected")
+                self.logger.debug("CNN -> Graph connection detected")
                 if hasattr(source_comp, '_metrics'):
-                    print("Canvas: Passing metrics and predictions to graph component")
+                    self.logger.debug("Passing metrics and predictions to graph component")
                     target_comp.execute({
                         "input": {
                             "metrics": source_comp._metrics,
@@ -212,18 +359,30 @@ class WorkflowCanvas(QGraphicsView):
                         }
                     })
                 else:
-                    print("Canvas: No metrics available yet – CNN component needs to be trained first")
+                    self.logger.debug("No metrics available yet - CNN component needs to be trained first")
             else:
-                print(f"Canvas: Generic connection between {type(source_comp).__name__} and {type(target_comp).__name__}")
+                self.logger.debug("Generic connection between %s and %s",
+                                  type(source_comp).__name__, type(target_comp).__name__)
                 # Generic data flow
                 result = source_comp.execute(inputs={})
                 if result and result.get("status") == "success":
                     target_comp.execute({"input": result.get("output")})
 
         except Exception as e:
-            print(f"Canvas ERROR in add_connection: {str(e)}")
+            self.logger.error(f"Failed to run connection data flow: {str(e)}")
 
-        self.update()
+        self._request_update()
+
+    def _request_update(self):
+        """Schedule one viewport repaint for everything changed this event-loop turn."""
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._flush_update)
+
+    def _flush_update(self):
+        """Repaint the viewport once for all pending changes."""
+        self._update_pending = False
+        self.viewport().update()
 
      
     def delete_selected_items(self):
@@ -232,13 +391,23 @@ class WorkflowCanvas(QGraphicsView):
         if not selected_items:
             return
             
-        self.push_undo_state()
-        
-        for item in selected_items:
-            if isinstance(item, WorkflowComponent):
-                self.remove_component(item)
-            elif isinstance(item, ConnectionLine):
-                self.remove_connection(item)
+        macro = self._remove_items(selected_items)
+        if macro.commands:
+            self._push_command(macro)
+
+    def _remove_items(self, items) -> MacroCmd:
+        """Remove components and connections, recording only what was actually removed."""
+        macro = MacroCmd()
+        for item in items:
+            if isinstance(item, WorkflowComponent) and item.id in self.components:
+                command = RemoveComponentCmd(item, list(self._edges_by_component.get(item.id, ())))
+            elif isinstance(item, ConnectionLine) and item in self.connections:
+                command = RemoveConnectionCmd(item)
+            else:
+                continue
+            command.do(self)
+            macro.commands.append(command)
+        return macro
 
     def remove_component(self, component):
         """Remove a component and all its connections."""
@@ -246,27 +415,32 @@ class WorkflowCanvas(QGraphicsView):
             return
 
         # Find and remove all connections to/from this component
-        connections_to_remove = {
-            conn for conn in self.connections 
-            if conn.start_port.parent() == component or 
-               conn.end_port.parent() == component
-        }
+        connections_to_remove = list(self._edges_by_component.get(component.id, ()))
         
         for conn in connections_to_remove:
             self.remove_connection(conn)
             
         # Remove the component
+        try:
+            component.position_changed.disconnect()
+        except TypeError:
+            pass
         self.scene.removeItem(component)
         del self.components[component.id]
+        self._edges_by_component.pop(component.id, None)
+        self._result_cache.pop(component.id, None)
+        self._invalidate_graph_cache()
         self.modified = True
+        self._request_update()
         self.status_message.emit(f"Removed {component.title}")
 
     def remove_connection(self, connection):
         """Remove a connection between components."""
         if connection in self.connections:
-            self.connections.remove(connection)
+            self._unregister_connection(connection)
             self.scene.removeItem(connection)
             self.modified = True
+            self._request_update()
             self.status_message.emit("Connection removed")
 
     def contextMenuEvent(self, event):
@@ -294,6 +468,59 @@ class WorkflowCanvas(QGraphicsView):
         except Exception as e:
             self.logger.error(f"Failed to update connections: {str(e)}")
 
+    def _update_component_edges(self, component_id: str):
+        """Update only the connections attached to a moved component."""
+        try:
+            edges = self._edges_by_component.get(component_id)
+            if not edges:
+                return
+            # One pos() call per component instead of a scenePos() per port
+            xy_by_component = {}
+            starts = np.empty((len(edges), 2))
+            ends = np.empty((len(edges), 2))
+            for i, conn in enumerate(edges):
+                for port, out in ((conn.start_port, starts), (conn.end_port, ends)):
+                    owner = port.parent()
+                    xy = xy_by_component.get(owner.id)
+                    if xy is None:
+                        xy = xy_by_component[owner.id] = owner.port_scene_xy()
+                    out[i] = xy[port.offset_index]
+            paths = build_connection_paths(starts, ends)
+            for connection, path, start, end in zip(edges, paths, starts.tolist(), ends.tolist()):
+                connection._endpoints = (*start, *end)
+                connection.prepareGeometryChange()
+                connection.setPath(path)
+        except Exception as e:
+            self.logger.error(f"Failed to update connections: {str(e)}")
+
+    def _register_connection(self, connection):
+        """Track a connection and index it by both endpoint components."""
+        self.connections.add(connection)
+        self._connected_inputs.add(connection.end_port)
+        self._invalidate_graph_cache()
+        self._edges_by_component[connection.start_port.parent().id].append(connection)
+        self._edges_by_component[connection.end_port.parent().id].append(connection)
+
+    def attach_connection(self, connection):
+        """Put an existing connection back on the canvas without re-running data flow."""
+        if connection in self.connections:
+            return
+        if connection.scene() is not self.scene:
+            self.scene.addItem(connection)
+        self._register_connection(connection)
+        connection.update_position()
+        self.modified = True
+
+    def _unregister_connection(self, connection):
+        """Stop tracking a connection and drop it from the endpoint index."""
+        self.connections.discard(connection)
+        self._connected_inputs.discard(connection.end_port)
+        self._invalidate_graph_cache()
+        for component in (connection.start_port.parent(), connection.end_port.parent()):
+            edges = self._edges_by_component.get(component.id)
+            if edges and connection in edges:
+                edges.remove(connection)
+
     def start_connection(self, port):
         """Start drawing a connection from a port."""
         try:
@@ -310,10 +537,11 @@ class WorkflowCanvas(QGraphicsView):
     def finish_connection(self, end_port):
         """Complete a connection to an end port."""
         if self.current_connection:
-            print("Canvas: Completing connection")
+            self.logger.debug("Completing connection")
             self.current_connection.end_port = end_port
             self.current_connection.update_position()
             self.add_connection(self.current_connection)
+            self._push_command(AddConnectionCmd(self.current_connection))
             self.current_connection = None
 
     def can_connect(self, port1, port2):
@@ -331,7 +559,13 @@ class WorkflowCanvas(QGraphicsView):
                 
             # Check for existing connections to input port
             input_port = port2 if not port2.is_output else port1
-            if any(conn.end_port == input_port for conn in self.connections):
+            if input_port in self._connected_inputs:
+                return False
+                
+            # Reject edges that would close a cycle: output -> input is only
+            # safe if the output's component is not reachable from the input's
+            output_port = port1 if port1.is_output else port2
+            if self._reaches(input_port.parent().id, output_port.parent().id):
                 return False
                 
             # Validate port types match
@@ -344,37 +578,35 @@ class WorkflowCanvas(QGraphicsView):
             self.logger.error(f"Connection validation failed: {str(e)}")
             return False
 
-    def mouseMoveEvent(self, event):
-        """Handle mouse move events."""
-        if self.current_connection:
-            self.update_current_connection(event.pos())
-        else:
-            super().mouseMoveEvent(event)
-
-    def mouseReleaseEvent(self, event):
-        """Handle mouse release events."""
-        if event.button() == Qt.LeftButton and self.current_connection:
-            item = self.itemAt(event.pos())
-            if isinstance(item, Port):
-                if self.finish_connection(item):
-                    self.connection_created.emit(self.current_connection)
-            else:
-                self.scene.removeItem(self.current_connection)
-                self.current_connection = None
+    def _push_command(self, command):
+        """Record an already-applied command for undo.
         
-        super().mouseReleaseEvent(event)
-    
-    def push_undo_state(self):
-        """Push current state to undo stack."""
-        try:
-            state = self.save_state()
-            if len(self.undo_stack) >= self.max_undo_steps:
-                self.undo_stack.pop(0)
-                self.undo_stack.append(state)
-                self.redo_stack.clear()
-                self.modified = True
-        except Exception as e:
-            self.logger.error(f"Failed to push undo state: {str(e)}")
+        Commands pushed during the same event-loop turn are coalesced into
+        a single undo step when the deferred flush runs.
+        """
+        self._pending_commands.append(command)
+        self.redo_stack.clear()
+        self.modified = True
+        if not self._pending_push:
+            self._pending_push = True
+            QTimer.singleShot(0, self._flush_pending_commands)
+
+    def _flush_pending_commands(self):
+        """Move pending commands onto the undo stack as one step."""
+        self._pending_push = False
+        if not self._pending_commands:
+            return
+        commands, self._pending_commands = self._pending_commands, []
+        self.undo_stack.append(commands[0] if len(commands) == 1 else MacroCmd(commands))
+        if len(self.undo_stack) > self.max_undo_steps:
+            self.undo_stack.pop(0)
+
+    def _record_moves(self):
+        """Push a move command for components dragged since the last press."""
+        for component, old_pos in self._move_origins.items():
+            if component.id in self.components and component.pos() != old_pos:
+                self._push_command(MoveComponentCmd(component, old_pos, component.pos()))
+        self._move_origins = {}
 
     def save_state(self) -> dict:
         """Save current state of the canvas."""
@@ -417,6 +649,7 @@ class WorkflowCanvas(QGraphicsView):
             for comp_id, comp_data in state['components'].items():
                 component = self.create_component({'type': comp_data['type']})
                 if component:
+                    component.id = comp_id
                     component.setPos(comp_data['position']['x'], 
                                   comp_data['position']['y'])
                     if hasattr(component, 'properties'):
@@ -432,19 +665,23 @@ class WorkflowCanvas(QGraphicsView):
 
     def restore_connection(self, conn_data: dict):
         """Restore a connection from saved data."""
+        start, end = conn_data['start_port'], conn_data['end_port']
+        self._restore_link(start['component'], start['port_name'],
+                           end['component'], end['port_name'])
+
+    def _restore_link(self, start_id: str, start_name: str, end_id: str, end_name: str):
+        """Connect an output port to an input port, looked up by id and name."""
         try:
             # Find components
-            start_comp = self.components.get(conn_data['start_port']['component'])
-            end_comp = self.components.get(conn_data['end_port']['component'])
+            start_comp = self.components.get(start_id)
+            end_comp = self.components.get(end_id)
             
             if not (start_comp and end_comp):
                 return
             
             # Find ports
-            start_port = next((p for p in start_comp.output_ports.values() 
-                             if p.name == conn_data['start_port']['port_name']), None)
-            end_port = next((p for p in end_comp.input_ports.values() 
-                           if p.name == conn_data['end_port']['port_name']), None)
+            start_port = start_comp.output_ports.get(start_name)
+            end_port = end_comp.input_ports.get(end_name)
             
             if not (start_port and end_port):
                 return
@@ -452,7 +689,7 @@ class WorkflowCanvas(QGraphicsView):
             # Create connection
             connection = ConnectionLine(start_port, end_port)
             self.scene.addItem(connection)
-            self.connections.add(connection)
+            self._register_connection(connection)
             connection.update_position()
             
         except Exception as e:
@@ -460,28 +697,30 @@ class WorkflowCanvas(QGraphicsView):
 
     def undo(self):
         """Perform undo operation."""
+        self._flush_pending_commands()
         if not self.undo_stack:
             return
             
         try:
-            current_state = self.save_state()
-            self.redo_stack.append(current_state)
-            state = self.undo_stack.pop()
-            self.restore_state(state)
+            command = self.undo_stack.pop()
+            command.undo(self)
+            self.redo_stack.append(command)
+            self.modified = True
             self.status_message.emit("Undo")
         except Exception as e:
             self.logger.error(f"Undo failed: {str(e)}")
 
     def redo(self):
         """Perform redo operation."""
+        self._flush_pending_commands()
         if not self.redo_stack:
             return
             
         try:
-            current_state = self.save_state()
-            self.undo_stack.append(current_state)
-            state = self.redo_stack.pop()
-            self.restore_state(state)
+            command = self.redo_stack.pop()
+            command.do(self)
+            self.undo_stack.append(command)
+            self.modified = True
             self.status_message.emit("Redo")
         except Exception as e:
             self.logger.error(f"Redo failed: {str(e)}")
@@ -489,13 +728,26 @@ class WorkflowCanvas(QGraphicsView):
     def clear(self, save_state: bool = True):
         """Clear the canvas."""
         if save_state:
-            self.push_undo_state()
+            # Detach components first so the undo step keeps them alive
+            macro = self._remove_items(list(self.components.values()))
+            if macro.commands:
+                self._push_command(macro)
+        else:
+            # scene.clear() deletes the items, so older undo steps would dangle
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+            self._pending_commands.clear()
             
-        for item in self.scene.items():
-            self.scene.removeItem(item)
+        # Let views holding components (the property editor) drop them first
+        self.cleared.emit()
+        self.scene.clear()
             
         self.components.clear()
         self.connections.clear()
+        self._edges_by_component.clear()
+        self._connected_inputs.clear()
+        self._result_cache.clear()
+        self._invalidate_graph_cache()
         self.current_connection = None
         self.modified = False
         self.status_message.emit("Canvas cleared")
@@ -504,79 +756,22 @@ class WorkflowCanvas(QGraphicsView):
         """Method to check if canvas is modified (for compatibility)."""
         return self.modified
 
-    def dragEnterEvent(self, event):
-        """Handle drag enter events."""
-        self.logger.debug("Drag enter event received")
-        if event.mimeData().hasText():
-            try:
-                # Try to parse component data
-                component_data = json.loads(event.mimeData().text())
-                if "type" in component_data:
-                    event.acceptProposedAction()
-                    self.logger.debug("Drag enter accepted")
-                    return
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Failed to parse drag data: {str(e)}")
-                
-        # Handle workflow files
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().endswith('.workflow'):
-                    event.acceptProposedAction()
-                    return
-
     def dragMoveEvent(self, event):
         """Handle drag move events."""
         if event.mimeData().hasText():
             event.acceptProposedAction()
 
-    def dropEvent(self, event):
-        """Handle drop events."""
-        try:
-            self.logger.debug("Drop event received")
-            if event.mimeData().hasText():
-                # Get the drop position in scene coordinates
-                pos = self.mapToScene(event.pos())
-                
-                # Parse component data
-                component_data = json.loads(event.mimeData().text())
-                self.logger.debug(f"Dropped component data: {component_data}")
-                
-                # Create the component
-                component = self.create_component(component_data)
-                if component:
-                    # Position the component
-                    component.setPos(pos.x() - component.boundingRect().width()/2,
-                                  pos.y() - component.boundingRect().height()/2)
-                    
-                    # Add to canvas
-                    self.add_component(component)
-                    event.acceptProposedAction()
-                    self.logger.debug(f"Component {component.title} added successfully")
-                    return
-                    
-        except Exception as e:
-            self.logger.error(f"Drop event failed: {str(e)}")
-
     def create_component(self, data: dict) -> Optional[WorkflowComponent]:
         """Create a new component from drop data."""
         try:
-            self.logger.debug(f"Creating component from data: {data}")
+            self.logger.debug("Creating component from data: %s", data)
             component_type = data.get("type")
             
-            # Import and create appropriate component
-            if component_type == "FileComponent":
-                from src.frontend.components.file_component import FileComponent
-                return FileComponent()
-            elif component_type == "GraphComponent":
-                from src.frontend.components.graph_component import GraphComponent
-                return GraphComponent()
-            elif component_type == "CNNComponent":
-                from src.frontend.components.cnn_component import CNNComponent
-                return CNNComponent()
-            else:
+            component_class = _COMPONENT_REGISTRY.get(component_type)
+            if component_class is None:
                 self.logger.error(f"Unknown component type: {component_type}")
                 return None
+            return component_class()
                 
         except Exception as e:
             self.logger.error(f"Failed to create component: {str(e)}")
@@ -585,16 +780,17 @@ class WorkflowCanvas(QGraphicsView):
     def add_component(self, component: WorkflowComponent, save_state: bool = True) -> None:
         """Add a component to the canvas."""
         try:
-            if save_state:
-                self.push_undo_state()
-                
             self.scene.addItem(component)
             self.components[component.id] = component
+            self._invalidate_graph_cache()
             
             # Connect signals
             if hasattr(component, 'position_changed'):
-                component.position_changed.connect(self.update_connections)
+                component.position_changed.connect(
+                    lambda: self._update_component_edges(component.id))
             
+            if save_state:
+                self._push_command(AddComponentCmd(component))
             self.modified = True
             self.status_message.emit(f"Added {component.title}")
             
@@ -604,7 +800,14 @@ class WorkflowCanvas(QGraphicsView):
     def _setup_view_properties(self):
         """Configure view properties for optimal rendering."""
         self.setRenderHint(QPainter.Antialiasing)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self._grid_pen = QPen(QColor("#f0f0f0"))
+        # Repaint only dirty regions: the canvas holds few items that change
+        # rarely, so clipping to their bounds beats redrawing the whole
+        # viewport (FullViewportUpdate only wins with many items moving
+        # every frame).
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        if self.use_opengl:
+            self._setup_opengl_viewport()
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -612,13 +815,36 @@ class WorkflowCanvas(QGraphicsView):
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setAcceptDrops(True)
         
+    def _setup_opengl_viewport(self):
+        """Render through a GPU-backed viewport for large graphs."""
+        try:
+            self.setViewport(QOpenGLWidget())
+            # QOpenGLWidget cannot do partial updates
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        except Exception as e:
+            self.logger.debug(f"OpenGL viewport unavailable, using raster: {str(e)}")
+        
     def _initialize_state(self):
         """Initialize canvas state variables."""
         self.components: Dict[str, WorkflowComponent] = {}
         self.connections: Set[ConnectionLine] = set()
+        self._edges_by_component: Dict[str, List[ConnectionLine]] = defaultdict(list)
+        self._connected_inputs: Set[Port] = set()
+        self._exec_layers_cache: Optional[List[List[WorkflowComponent]]] = None
+        self._incoming_cache: Optional[Dict[str, list]] = None
+        self._outgoing_cache: Optional[Dict[str, List[str]]] = None
+        # component id -> (_result_key, result) of its last successful run,
+        # least recently used first and capped at RESULT_CACHE_SIZE
+        self._result_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._result_versions: Dict[str, int] = {}
+        # component id -> {output port: value} produced during the current run
+        self._run_outputs: Dict[str, Dict[str, Any]] = {}
         self.current_connection: Optional[ConnectionLine] = None
         self.is_panning = False
         self.last_mouse_pos = None
+        self._move_origins: Dict[WorkflowComponent, QPointF] = {}
+        self._update_pending = False
         self._modified = False
         
     def _setup_undo_redo(self):
@@ -626,6 +852,8 @@ class WorkflowCanvas(QGraphicsView):
         self.undo_stack = []
         self.redo_stack = []
         self.max_undo_steps = 50
+        self._pending_commands = []
+        self._pending_push = False
 
     def dragEnterEvent(self, event):
         """Handle component drag enter events."""
@@ -651,9 +879,8 @@ class WorkflowCanvas(QGraphicsView):
                 pos = self.mapToScene(event.pos())
                 
                 # Snap to grid
-                grid_size = 20
-                pos.setX(round(pos.x() / grid_size) * grid_size)
-                pos.setY(round(pos.y() / grid_size) * grid_size)
+                pos.setX(self._snap(pos.x()))
+                pos.setY(self._snap(pos.y()))
                 
                 component_data = json.loads(event.mimeData().text())
                 component = self.create_component(component_data)
@@ -679,6 +906,10 @@ class WorkflowCanvas(QGraphicsView):
                 item.setSelected(True)
             
             super().mousePressEvent(event)
+            self._move_origins = {
+                selected: selected.pos() for selected in self.scene.selectedItems()
+                if isinstance(selected, WorkflowComponent)
+            }
 
     def mouseMoveEvent(self, event):
         """Handle mouse move events for connection drawing and panning."""
@@ -698,7 +929,7 @@ class WorkflowCanvas(QGraphicsView):
         """Handle mouse release events for completing connections."""
         if event.button() == Qt.LeftButton and self.current_connection:
             item = self.itemAt(event.pos())
-            if isinstance(item, Port):
+            if isinstance(item, Port) and self.can_connect(self.current_connection.start_port, item):
                 if self.finish_connection(item):
                     self.connection_created.emit(self.current_connection)
             else:
@@ -706,15 +937,19 @@ class WorkflowCanvas(QGraphicsView):
                 self.current_connection = None
                 
         super().mouseReleaseEvent(event)
+        self._record_moves()
+
+    def toggle_pan_mode(self):
+        """Switch between rubber-band selection and hand-drag panning."""
+        self.is_panning = not self.is_panning
+        self.last_mouse_pos = None
+        self.setDragMode(QGraphicsView.ScrollHandDrag if self.is_panning
+                         else QGraphicsView.RubberBandDrag)
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts."""
         if event.key() == Qt.Key_Delete:
-            for item in self.scene.selectedItems():
-                if isinstance(item, WorkflowComponent):
-                    self.remove_component(item)
-                elif isinstance(item, ConnectionLine):
-                    self.remove_connection(item)
+            self.delete_selected_items()
         elif event.key() == Qt.Key_Space:
             self.toggle_pan_mode()
         elif event.modifiers() & Qt.ControlModifier:
@@ -728,19 +963,19 @@ class WorkflowCanvas(QGraphicsView):
                 
         super().keyPressEvent(event)
 
-    # ... [Previous methods remain unchanged] ...
-
     def validate_workflow(self) -> List[str]:
         """Validate the entire workflow before execution."""
         issues = []
         
+        # Reuse the cached wiring index that execution reads afterwards
+        incoming = self._get_incoming()
+        
         # Validate components
         for component in self.components.values():
             # Check required inputs
+            connected = {wire[0] for wire in incoming.get(component.id, ())}
             for port_name in component.get_required_inputs():
-                if not any(conn.end_port.parent() == component and 
-                          conn.end_port.name == port_name 
-                          for conn in self.connections):
+                if port_name not in connected:
                     issues.append(f"{component.title}: Required input '{port_name}' not connected")
         
         # Check for cycles
@@ -751,27 +986,21 @@ class WorkflowCanvas(QGraphicsView):
 
     def _has_cycles(self) -> bool:
         """Check for cycles in the workflow using DFS."""
-        visited = set()
-        path = set()
-        
-        def visit(component):
-            if component in path:
-                return True
-            if component in visited:
-                return False
-            
-            visited.add(component)
-            path.add(component)
-            
-            for conn in self.connections:
-                if conn.start_port.parent() == component:
-                    if visit(conn.end_port.parent()):
-                        return True
-            
-            path.remove(component)
-            return False
+        return bool(has_cycle_csr(*self._build_csr()))
+
+    def _build_csr(self):
+        """Build a CSR (indptr, indices) adjacency array over the components."""
+        index = {comp_id: i for i, comp_id in enumerate(self.components)}
+        count = len(self.connections)
+        sources = np.fromiter((index[conn.start_port.parent().id] for conn in self.connections),
+                              dtype=np.int64, count=count)
+        targets = np.fromiter((index[conn.end_port.parent().id] for conn in self.connections),
+                              dtype=np.int64, count=count)
         
-        return any(visit(comp) for comp in self.components.values())
+        indptr = np.zeros(len(index) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(index)), out=indptr[1:])
+        indices = targets[np.argsort(sources, kind='stable')]
+        return indptr, indices
 
     def execute_workflow(self) -> Dict[str, Any]:
         """Execute the workflow with progress tracking."""
@@ -787,24 +1016,41 @@ class WorkflowCanvas(QGraphicsView):
                                   f"Cannot execute workflow:\n\n{issues_text}")
                 return {}
             
-            # Execute components in order
-            ordered_components = self._get_execution_order()
+            # Execute components layer by layer
             results = {}
+            self._run_outputs = {}
+            completed = 0
+            last_update = 0.0
             
-            for i, component in enumerate(ordered_components):
-                if progress.wasCanceled():
-                    break
+            with ThreadPoolExecutor() as pool:
+                for layer in self._get_execution_layers():
+                    if progress.wasCanceled():
+                        break
                     
-                progress.setValue(i)
-                progress.setLabelText(f"Executing {component.title}...")
-                
-                # Execute component
-                component_results = self._execute_component(component)
-                if component_results.get("status") == "error":
-                    raise RuntimeError(f"Component {component.title} failed: {component_results.get('error')}")
+                    # Repaint at most once per frame; fast components would
+                    # otherwise spend their time repainting the dialog
+                    now = time.monotonic()
+                    if now - last_update >= self.PROGRESS_INTERVAL:
+                        progress.setValue(completed)
+                        progress.setLabelText(f"Executing {', '.join(comp.title for comp in layer)}...")
+                        last_update = now
+                    else:
+                        # Still pump events so Cancel and the window stay responsive
+                        QApplication.processEvents()
                     
-                results[component.id] = component_results
-                
+                    # Execute the layer's components
+                    for component, component_results in zip(layer, self._execute_layer(layer, pool)):
+                        if component_results.get("status") == "error":
+                            raise RuntimeError(f"Component {component.title} failed: {component_results.get('error')}")
+                        results[component.id] = component_results
+                        # Only port values feed downstream inputs
+                        self._run_outputs[component.id] = {
+                            name: component_results[name]
+                            for name in component.output_ports if name in component_results}
+                    completed += len(layer)
+            
+            # Skipped updates must not leave the bar short of the final count
+            progress.setValue(completed)
             return results
             
         except Exception as e:
@@ -816,128 +1062,325 @@ class WorkflowCanvas(QGraphicsView):
         finally:
             progress.close()
 
-    def _get_execution_order(self) -> List[WorkflowComponent]:
+    def _get_execution_layers(self) -> List[List[WorkflowComponent]]:
         """
-        Determine the correct execution order of components using topological sort.
-        Returns a list of components in execution order.
+        Group components into topological layers using Kahn's algorithm.
+        Components in the same layer do not depend on each other, so a
+        layer only needs every earlier layer to have finished.
         Raises RuntimeError if a cycle is detected.
+        The layers are cached until the graph changes.
         """
-        # Initialize data structures
-        in_degree = {comp: 0 for comp in self.components.values()}
-        graph = {comp: set() for comp in self.components.values()}
+        if self._exec_layers_cache is not None:
+            return [list(layer) for layer in self._exec_layers_cache]
+        
+        # Resolve each edge's endpoints once, keyed by component id
+        edges = [(conn.start_port.parent().id, conn.end_port.parent().id)
+                 for conn in self.connections]
         
         # Build the graph and calculate in-degrees
-        for connection in self.connections:
-            source = connection.start_port.parent()
-            target = connection.end_port.parent()
-            graph[source].add(target)
-            in_degree[target] += 1
+        in_degree = dict.fromkeys(self.components, 0)
+        graph = {comp_id: [] for comp_id in self.components}
+        for source_id, target_id in edges:
+            graph[source_id].append(target_id)
+            in_degree[target_id] += 1
         
         # Initialize queue with nodes that have no dependencies
-        queue = [comp for comp, degree in in_degree.items() if degree == 0]
+        queue = deque(comp_id for comp_id, degree in in_degree.items() if degree == 0)
         if not queue:
             raise RuntimeError("Circular dependency detected: no valid starting point found")
         
-        # Process the queue
-        execution_order = []
+        # Drain the queue one layer at a time
+        layers = []
+        ordered = 0
         while queue:
-            # Take the next component from queue
-            current = queue.pop(0)
-            execution_order.append(current)
+            layer_ids = list(queue)
+            queue.clear()
+            layers.append([self.components[comp_id] for comp_id in layer_ids])
+            ordered += len(layer_ids)
             
-            # Process all components that depend on current
-            for dependent in graph[current]:
-                in_degree[dependent] -= 1
-                # If all dependencies are satisfied, add to queue
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
+            # Process all components that depend on this layer
+            for current in layer_ids:
+                for dependent in graph[current]:
+                    in_degree[dependent] -= 1
+                    # If all dependencies are satisfied, queue for the next layer
+                    if in_degree[dependent] == 0:
+                        queue.append(dependent)
         
         # Check for cycles
-        if len(execution_order) != len(self.components):
+        if ordered != len(self.components):
             raise RuntimeError("Circular dependency detected: not all components can be ordered")
             
-        self.logger.debug(f"Execution order determined: {[comp.title for comp in execution_order]}")
-        return execution_order
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Execution layers determined: %s",
+                              [[comp.title for comp in layer] for layer in layers])
+        self._exec_layers_cache = layers
+        return [list(layer) for layer in layers]
+
+    def _get_execution_order(self) -> List[WorkflowComponent]:
+        """
+        Determine the correct execution order of components using topological sort.
+        Returns a list of components in execution order.
+        Raises RuntimeError if a cycle is detected.
+        """
+        return [comp for layer in self._get_execution_layers() for comp in layer]
+
+    def _get_incoming(self) -> Dict[str, list]:
+        """Map each component id to its (target_port, source_component, source_port) wiring."""
+        if self._incoming_cache is None:
+            incoming = defaultdict(list)
+            for conn in self.connections:
+                incoming[conn.end_port.parent().id].append(
+                    (conn.end_port.name, conn.start_port.parent(), conn.start_port.name))
+            self._incoming_cache = incoming
+        return self._incoming_cache
+
+    def _get_outgoing(self) -> Dict[str, List[str]]:
+        """Map each component id to the ids of the components it feeds."""
+        if self._outgoing_cache is None:
+            outgoing = defaultdict(list)
+            for conn in self.connections:
+                outgoing[conn.start_port.parent().id].append(conn.end_port.parent().id)
+            self._outgoing_cache = outgoing
+        return self._outgoing_cache
+
+    def _reaches(self, start_id: str, goal_id: str) -> bool:
+        """Check whether goal_id is downstream of start_id."""
+        outgoing = self._get_outgoing()
+        seen = {start_id}
+        stack = [start_id]
+        while stack:
+            for next_id in outgoing.get(stack.pop(), ()):
+                if next_id == goal_id:
+                    return True
+                if next_id not in seen:
+                    seen.add(next_id)
+                    stack.append(next_id)
+        return start_id == goal_id
+
+    def _invalidate_graph_cache(self):
+        """Drop the cached execution order and wiring indexes."""
+        self._exec_layers_cache = None
+        self._incoming_cache = None
+        self._outgoing_cache = None
 
-    def _execute_component(self, component: WorkflowComponent) -> Dict[str, Any]:
-        """Execute a single component with error handling."""
+    def _execute_layer(self, layer: List[WorkflowComponent],
+                       pool: ThreadPoolExecutor) -> List[Dict[str, Any]]:
+        """Execute one topological layer, running thread-safe components concurrently."""
+        # Inputs are gathered here on the GUI thread; workers only run execute()
+        futures = {}
+        if len(layer) > 1:
+            for component in layer:
+                if component.thread_safe:
+                    futures[component.id] = pool.submit(
+                        self._execute_component, component, self._get_component_inputs(component))
+        
+        results = {component.id: self._execute_component(component)
+                   for component in layer if component.id not in futures}
+        
+        # Keep the progress dialog responsive while workers finish
+        pending = set(futures.values())
+        while pending:
+            _, pending = wait(pending, timeout=0.05)
+            QApplication.processEvents()
+        results.update((comp_id, future.result()) for comp_id, future in futures.items())
+        
+        return [results[component.id] for component in layer]
+
+    def _execute_component(self, component: WorkflowComponent,
+                           inputs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Execute a single component with error handling.
+        
+        Results are reused while the component's properties and upstream
+        results are unchanged.
+        """
         try:
+            if component.cache_results:
+                with self._result_cache_lock:
+                    cached = self._result_cache.get(component.id)
+                    if cached is not None:
+                        self._result_cache.move_to_end(component.id)
+                if cached is not None and cached[0] == self._result_key(component):
+                    self.logger.debug("Reusing cached result for %s", component.title)
+                    return cached[1]
+            
             # Get input data from connected components
-            inputs = self._get_component_inputs(component)
+            if inputs is None:
+                inputs = self._get_component_inputs(component)
             
-            # Execute component
-            return component.execute(inputs)
+            # Execute component; a fresh run invalidates downstream results
+            result = component.execute(inputs)
+            self._result_versions[component.id] = self._result_versions.get(component.id, 0) + 1
+            if component.cache_results and result.get("status") != "error":
+                key = self._result_key(component)
+                with self._result_cache_lock:
+                    self._result_cache[component.id] = (key, result)
+                    self._result_cache.move_to_end(component.id)
+                    while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                        self._result_cache.popitem(last=False)
+            return result
             
         except Exception as e:
             return {"status": "error", "error": str(e)}
 
+    def _result_key(self, component: WorkflowComponent) -> tuple:
+        """Fingerprint a component's cache_key and the upstream results it reads."""
+        upstream = tuple(sorted(
+            (target_port, source.id, source_port, self._result_versions.get(source.id, 0))
+            for target_port, source, source_port in self._get_incoming().get(component.id, ())))
+        return component.cache_key(), upstream
+
     def _get_component_inputs(self, component: WorkflowComponent) -> Dict[str, Any]:
         """Get input data for a component from its connections."""
         inputs = {}
-        for conn in self.connections:
-            if conn.end_port.parent() == component:
-                source_component = conn.start_port.parent()
-                source_port = conn.start_port.name
-                target_port = conn.end_port.name
+        for target_port, source_component, source_port in self._get_incoming().get(component.id, ()):
+            # Sources sit in earlier layers, so their outputs are already recorded
+            source_outputs = self._run_outputs.get(source_component.id, {})
+            if source_port in source_outputs:
+                inputs[target_port] = source_outputs[source_port]
                 
-                # Get output from source component
-                source_outputs = source_component.get_outputs()
-                if source_port in source_outputs:
-                    inputs[target_port] = source_outputs[source_port]
-                    
         return inputs
 
-    def _draw_grid(self):
-        """Draw background grid for visual guidance."""
-        grid_size = 20
-        grid_color = QColor("#f0f0f0")
+    @classmethod
+    def _snap(cls, value: float) -> float:
+        """Round a coordinate to the nearest grid line."""
+        return float((math.floor(value) + (cls.GRID_SIZE >> 1)) & ~(cls.GRID_SIZE - 1))
+
+    def drawBackground(self, painter: QPainter, rect: QRectF):
+        """Draw the background grid for the exposed area in one call."""
+        super().drawBackground(painter, rect)
+        grid_size = self.GRID_SIZE
+        left = math.floor(rect.left()) & ~(grid_size - 1)
+        top = math.floor(rect.top()) & ~(grid_size - 1)
+        right, bottom = rect.right(), rect.bottom()
         
-        for x in range(0, int(self.scene.width()), grid_size):
-            self.scene.addLine(x, 0, x, self.scene.height(), QPen(grid_color))
-            
-        for y in range(0, int(self.scene.height()), grid_size):
-            self.scene.addLine(0, y, self.scene.width(), y, QPen(grid_color))
+        lines = [QLineF(x, top, x, bottom) for x in range(left, math.ceil(right) + 1, grid_size)]
+        lines += [QLineF(left, y, right, y) for y in range(top, math.ceil(bottom) + 1, grid_size)]
+        
+        painter.setPen(self._grid_pen)
+        painter.drawLines(lines)
 
     
+    def encode_workflow(self) -> Tuple[List[Tuple[bytes, bytes]], List[bytes]]:
+        """Encode the workflow as JSON fragments for write_workflow_file.
+
+        Reads the scene, so it must run on the GUI thread.
+
+        Returns:
+            (component_id, component_entry) pairs and connection entries
+        """
+        components = [
+            (_dump_json(comp_id), _dump_json({
+                'type': component.__class__.__name__,
+                'position': {
+                    'x': component.pos().x(),
+                    'y': component.pos().y()
+                },
+                # Underscore-prefixed properties are private runtime state
+                'properties': {key: value for key, value in component.get_properties().items()
+                               if not key.startswith('_')}
+            }))
+            for comp_id, component in self.components.items()
+        ]
+        connections = [
+            _dump_json({
+                'start': {
+                    'component': connection.start_port.parent().id,
+                    'port': connection.start_port.name
+                },
+                'end': {
+                    'component': connection.end_port.parent().id,
+                    'port': connection.end_port.name
+                }
+            })
+            for connection in self.connections
+        ]
+        return components, connections
+
+    @staticmethod
+    def write_workflow_file(filename: str, components: List[Tuple[bytes, bytes]],
+                            connections: List[bytes]):
+        """Write encoded workflow fragments to disk; safe off the GUI thread."""
+        # Stream one entry at a time into a uniquely named sibling file, then
+        # swap it in so an interrupted save leaves the previous workflow intact
+        fd, tmp_file = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(filename)))
+        try:
+            with open(fd, 'wb', buffering=1 << 20) as f:
+                f.write(b'{\n  "components": {')
+                for i, (comp_id, entry) in enumerate(components):
+                    f.write(b',\n    ' if i else b'\n    ')
+                    f.write(comp_id)
+                    f.write(b': ')
+                    f.write(entry)
+
+                f.write(b'\n  },\n  "connections": [')
+                for i, entry in enumerate(connections):
+                    f.write(b',\n    ' if i else b'\n    ')
+                    f.write(entry)
+
+                f.write(b'\n  ]\n}\n')
+            # mkstemp files are owner-only; keep the mode the workflow had
+            try:
+                os.chmod(tmp_file, os.stat(filename).st_mode & 0o777)
+            except FileNotFoundError:
+                os.chmod(tmp_file, 0o644)
+            os.replace(tmp_file, filename)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
+
     def save_to_file(self, filename: str) -> bool:
         """Save the workflow state to a file."""
         try:
-            workflow_state = {
-                'components': {},
-                'connections': []
-            }
-            
-            # Save components
-            for comp_id, component in self.components.items():
-                workflow_state['components'][comp_id] = {
-                    'type': component.__class__.__name__,
-                    'position': {
-                        'x': component.pos().x(),
-                        'y': component.pos().y()
-                    },
-                    'properties': component.get_properties()
-                }
-            
-            # Save connections
-            for connection in self.connections:
-                workflow_state['connections'].append({
-                    'start': {
-                        'component': connection.start_port.parent().id,
-                        'port': connection.start_port.name
-                    },
-                    'end': {
-                        'component': connection.end_port.parent().id,
-                        'port': connection.end_port.name
-                    }
-                })
-            
-            # Save to file
-            with open(filename, 'w') as f:
-                json.dump(workflow_state, f, indent=2)
-                
+            self.write_workflow_file(filename, *self.encode_workflow())
             self.modified = False
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Failed to save workflow: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def read_workflow_file(filename: str) -> Dict[str, Any]:
+        """Parse a saved workflow file; safe off the GUI thread."""
+        with open(filename, 'rb') as f:
+            return _load_json(f.read())
+
+    def load_workflow_data(self, workflow_data: Dict[str, Any]) -> bool:
+        """Rebuild the canvas from parsed workflow data."""
+        try:
+            self.clear(save_state=False)
+
+            # Create components
+            for comp_id, comp_data in workflow_data['components'].items():
+                component = self.create_component({'type': comp_data['type']})
+                if component:
+                    component.id = comp_id
+                    pos = comp_data['position']
+                    component.setPos(pos['x'], pos['y'])
+                    if 'properties' in comp_data:
+                        component.properties = comp_data['properties']
+                    self.add_component(component, save_state=False)
+
+            # Create connections; older files used source/target keys
+            for conn_data in workflow_data['connections']:
+                start = conn_data.get('start') or conn_data['source']
+                end = conn_data.get('end') or conn_data['target']
+                self._restore_link(start['component'], start['port'],
+                                   end['component'], end['port'])
+
+            self.modified = False
+            self.status_message.emit("Workflow loaded")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to load workflow: {str(e)}")
+            return False
+
+    def load_from_file(self, filename: str) -> bool:
+        """Load the workflow state from a file."""
+        try:
+            workflow_data = self.read_workflow_file(filename)
+        except Exception as e:
+            self.logger.error(f"Failed to read workflow: {str(e)}")
+            return False
+        return self.load_workflow_data(workflow_data)
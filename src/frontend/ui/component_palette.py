@@ -4,7 +4,7 @@ from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QScrollArea,
 from PyQt5.QtCore import Qt, pyqtSignal, QMimeData, QSize, QPoint
 from PyQt5.QtGui import QIcon, QDrag, QPixmap, QPainter, QColor, QBrush, QPen
 import json
-from typing import Optional, Dict, Type
+from typing import Optional, Dict, List, Tuple, Type
 import os
 
 
@@ -14,12 +14,83 @@ from src.frontend.components.graph_component import GraphComponent
 from src.frontend.components.cnn_component import CNNComponent
 from src.frontend.components.base import WorkflowComponent
 
+# Stylesheets are applied once on the palette and cascade to its children,
+# so Qt parses them once rather than once per button
+_BUTTON_QSS = """
+    QToolButton#componentButton {
+        border: 1px solid #e2e8f0;
+        border-radius: 6px;
+        background-color: white;
+        font-size: 11px;
+        padding: 4px;
+    }
+    QToolButton#componentButton:hover {
+        background-color: #f0f9ff;
+        border-color: #60a5fa;
+    }
+    QToolButton#componentButton:pressed {
+        background-color: #e0f2fe;
+        border-color: #3b82f6;
+    }
+"""
+
+_CATEGORY_QSS = """
+    CategoryWidget {
+        background: white;
+        border: 1px solid #e2e8f0;
+        border-radius: 8px;
+        margin: 4px;
+    }
+"""
+
+_HEADER_QSS = """
+    QLabel#categoryHeader {
+        font-size: 13px;
+        font-weight: bold;
+        color: #334155;
+        padding: 8px;
+        background: #f8fafc;
+        border-radius: 4px;
+        border: 1px solid #e2e8f0;
+    }
+"""
+
+_PALETTE_QSS = """
+    QDockWidget {
+        border: none;
+    }
+    QDockWidget::title {
+        background: #f8fafc;
+        padding: 8px;
+        border-bottom: 1px solid #e2e8f0;
+    }
+    QScrollArea {
+        border: none;
+        background: transparent;
+    }
+""" + _CATEGORY_QSS + _HEADER_QSS + _BUTTON_QSS
+
 class ComponentButton(QToolButton):
+    # Default icons keyed by a word in the button title; first match wins
+    _ICON_PATHS: Dict[str, str] = {
+        "File": ":/icons/file.png",
+        "Graph": ":/icons/graph.png",
+        "CNN": ":/icons/cnn.png",
+        "Data": ":/icons/data.png",
+        "Process": ":/icons/process.png",
+        "Visualize": ":/icons/visualize.png",
+    }
+    _DEFAULT_ICON_PATH = ":/icons/component.png"
+    
+    # Loaded icons shared by every button, keyed by path
+    _ICON_CACHE: Dict[str, QIcon] = {}
+    
     def __init__(self, title: str, component_class, icon_path: str = None, parent=None):
         super().__init__(parent)
         self.title = title
         self.component_class = component_class
         self.logger = get_logger(__name__)
+        self._drag_pixmap: Optional[QPixmap] = None
         
         # Setup button appearance
         self.setText(title)
@@ -27,164 +98,24 @@ class ComponentButton(QToolButton):
         self.setIconSize(QSize(32, 32))
         
         # Set icon directly here instead of separate method
-        if icon_path and os.path.exists(icon_path):
-            self.setIcon(QIcon(icon_path))
-        else:
-            # Default icons based on type
-            if "File" in title:
-                self.setIcon(QIcon(":/icons/file.png"))
-            elif "Graph" in title:
-                self.setIcon(QIcon(":/icons/graph.png"))
-            elif "CNN" in title:
-                self.setIcon(QIcon(":/icons/cnn.png"))
-            else:
-                self.setIcon(QIcon(":/icons/component.png"))
+        self.setIcon(self._icon_for(title, icon_path))
         
-        # Setup style
+        # Setup style; the rules come from the palette's stylesheet
+        self.setObjectName("componentButton")
         self.setFixedSize(80, 80)
-        self.setStyleSheet("""
-            QToolButton {
-                border: 1px solid #e2e8f0;
-                border-radius: 6px;
-                background-color: white;
-                font-size: 11px;
-                padding: 4px;
-            }
-            QToolButton:hover {
-                background-color: #f0f9ff;
-                border-color: #60a5fa;
-            }
-            QToolButton:pressed {
-                background-color: #e0f2fe;
-                border-color: #3b82f6;
-            }
-        """)
         
-    def _setup_icon(self, icon_path: str):  # Remove title parameter
-        """Setup the component icon."""
-        if icon_path and os.path.exists(icon_path):
-            self.setIcon(QIcon(icon_path))
-        else:
-            # Default icons based on component type
-            icon_map = {
-                "File": ":/icons/file.png",
-                "Graph": ":/icons/graph.png",
-                "CNN": ":/icons/cnn.png",
-                "Data": ":/icons/data.png",
-                "Process": ":/icons/process.png",
-                "Visualize": ":/icons/visualize.png"
-            }
-            
-            # Find matching icon based on the button's title
-            for key, path in icon_map.items():
-                if key in self.title:  # Use self.title instead of title parameter
-                    self.setIcon(QIcon(path))
-                    break
-            else:
-                # Default icon if no match found
-                self.setIcon(QIcon(":/icons/component.png"))
-    
-    def _setup_style(self):
-        """Setup the button's visual style."""
-        self.setFixedSize(80, 80)
-        self.setStyleSheet("""
-            QToolButton {
-                border: 1px solid #e2e8f0;
-                border-radius: 6px;
-                background-color: white;
-                font-size: 11px;
-                padding: 4px;
-            }
-            QToolButton:hover {
-                background-color: #f0f9ff;
-                border-color: #60a5fa;
-            }
-            QToolButton:pressed {
-                background-color: #e0f2fe;
-                border-color: #3b82f6;
-            }
-        """)
-
-    def mousePressEvent(self, event):
-        """Handle mouse press event to start drag operation."""
-        if event.button() == Qt.LeftButton:
-            try:
-                drag = QDrag(self)
-                mime_data = QMimeData()
-                
-                # Create component data
-                component_data = {
-                    "type": self.component_class.__name__,
-                    "title": self.title
-                }
-                mime_data.setText(json.dumps(component_data))
-                drag.setMimeData(mime_data)
-                
-                # Create drag pixmap
-                pixmap = QPixmap(self.size())
-                pixmap.fill(Qt.transparent)
-                painter = QPainter(pixmap)
-                self.render(painter)
-                painter.end()
-                
-                # Set drag hot spot to center
-                drag.setPixmap(pixmap)
-                drag.setHotSpot(QPoint(pixmap.width()//2, pixmap.height()//2))
-                
-                # Execute drag
-                result = drag.exec_(Qt.CopyAction)
-                self.logger.debug(f"Drag operation completed with result: {result}")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to start drag operation: {str(e)}")
-
+    @classmethod
+    def _icon_for(cls, title: str, icon_path: Optional[str] = None) -> QIcon:
+        """Return the shared icon for a button title or explicit icon path."""
+        # Qt resource paths need no filesystem check
+        if not icon_path or (not icon_path.startswith(":") and not os.path.exists(icon_path)):
+            icon_path = next((path for key, path in cls._ICON_PATHS.items() if key in title),
+                             cls._DEFAULT_ICON_PATH)
+        icon = cls._ICON_CACHE.get(icon_path)
+        if icon is None:
+            icon = cls._ICON_CACHE[icon_path] = QIcon(icon_path)
+        return icon
         
-    def _setup_icon(self, icon_path: str, title: str):
-        """Setup the component icon."""
-        if icon_path and os.path.exists(icon_path):
-            self.setIcon(QIcon(icon_path))
-        else:
-            # Default icons based on component type
-            icon_map = {
-                "File": ":/icons/file.png",
-                "Graph": ":/icons/graph.png",
-                "CNN": ":/icons/cnn.png",
-                "Data": ":/icons/data.png",
-                "Process": ":/icons/process.png",
-                "Visualize": ":/icons/visualize.png"
-            }
-            
-            # Find matching icon
-            for key, path in icon_map.items():
-                if key in title:
-                    self.setIcon(QIcon(path))
-                    break
-            else:
-                # Default icon if no match found
-                self.setIcon(QIcon(":/icons/component.png"))
-    
-    # In ComponentButton class, modify _setup_style method
-    def _setup_style(self):
-        """Setup the button's visual style."""
-        self.setFixedSize(80, 80)
-        self.setStyleSheet("""
-            QToolButton {
-                border: 1px solid #e2e8f0;
-                border-radius: 6px;
-                background-color: white;
-                font-size: 11px;
-                padding: 4px;
-            }
-            QToolButton:hover {
-                background-color: #f0f9ff;
-                border-color: #60a5fa;
-            }
-            QToolButton:pressed {
-                background-color: #e0f2fe;
-                border-color: #3b82f6;
-            }
-        """)
-    
     def mousePressEvent(self, event):
         """Handle mouse press event to start drag operation."""
         if event.button() == Qt.LeftButton:
@@ -203,8 +134,10 @@ class ComponentButton(QToolButton):
                 mime_data.setText(json.dumps(component_data))
                 drag.setMimeData(mime_data)
                 
-                # Create drag feedback pixmap
-                pixmap = self._create_drag_pixmap()
+                # Drag feedback pixmap; the button's look never changes
+                if self._drag_pixmap is None:
+                    self._drag_pixmap = self._create_drag_pixmap()
+                pixmap = self._drag_pixmap
                 drag.setPixmap(pixmap)
                 drag.setHotSpot(QPoint(pixmap.width() // 2, pixmap.height() // 2))
                 
@@ -276,32 +209,32 @@ class CategoryWidget(QFrame):
         self.current_col = 0
         self.max_cols = 3
         
-        # Apply styling
-        self.setStyleSheet("""
-            CategoryWidget {
-                background: white;
-                border: 1px solid #e2e8f0;
-                border-radius: 8px;
-                margin: 4px;
-            }
-        """)
+        # Buttons registered before the category is first shown
+        self._pending: List[Tuple[str, Type[WorkflowComponent]]] = []
         
     def _setup_header(self, title: str):
         """Setup the category header."""
         header = QLabel(title)
-        header.setStyleSheet("""
-            QLabel {
-                font-size: 13px;
-                font-weight: bold;
-                color: #334155;
-                padding: 8px;
-                background: #f8fafc;
-                border-radius: 4px;
-                border: 1px solid #e2e8f0;
-            }
-        """)
+        header.setObjectName("categoryHeader")
         self.layout.addWidget(header)
     
+    def defer_component(self, title: str, component_class: Type[WorkflowComponent]):
+        """Register a component whose button is built when the category is first shown."""
+        self._pending.append((title, component_class))
+        if self.isVisible():
+            self._create_pending_buttons()
+    
+    def showEvent(self, event):
+        """Build any deferred component buttons before the first paint."""
+        self._create_pending_buttons()
+        super().showEvent(event)
+    
+    def _create_pending_buttons(self):
+        """Create and place the buttons for deferred components."""
+        pending, self._pending = self._pending, []
+        for title, component_class in pending:
+            self.add_component(ComponentButton(title, component_class))
+    
     def add_component(self, component_button: ComponentButton):
         """Add a component button to the grid layout."""
         try:
@@ -359,41 +292,23 @@ class ComponentPalette(QDockWidget):
         # Add stretch to bottom
         self.layout.addStretch()
         
-        # Style the dock widget
-        self.setStyleSheet("""
-            QDockWidget {
-                border: none;
-            }
-            QDockWidget::title {
-                background: #f8fafc;
-                padding: 8px;
-                border-bottom: 1px solid #e2e8f0;
-            }
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-        """)
+        # Style the dock widget and, by cascade, its categories and buttons
+        self.setStyleSheet(_PALETTE_QSS)
         
         self.setWidget(scroll)
     
     def register_components(self):
         """Register available components in their respective categories."""
         try:
+            # Buttons are built when their category is first shown
             # Data Input components
-            self.categories["Data Input"].add_component(
-                ComponentButton("File Input", FileComponent)
-            )
+            self.categories["Data Input"].defer_component("File Input", FileComponent)
             
             # Processing components
-            self.categories["Processing"].add_component(
-                ComponentButton("DL Models", CNNComponent)
-            )
+            self.categories["Processing"].defer_component("DL Models", CNNComponent)
             
             # Visualization components
-            self.categories["Visualization"].add_component(
-                ComponentButton("Graph Output", GraphComponent)
-            )
+            self.categories["Visualization"].defer_component("Graph Output", GraphComponent)
             
         except Exception as e:
             self.logger.error(f"Failed to register components: {str(e)}")
@@ -2,17 +2,33 @@ from PyQt5.QtWidgets import (
     QMainWindow, QDockWidget, QToolBar, QStatusBar, QAction,
     QFileDialog, QMessageBox, QMenu, QShortcut, QProgressDialog
 )
-from PyQt5.QtCore import Qt, QSettings, QSize, QTimer
+from PyQt5.QtCore import Qt, QSettings, QSize, QTimer, QThreadPool
 from PyQt5.QtGui import QIcon, QKeySequence
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import os
+import sys
+import threading
 
 from src.backend.utils.loggers import get_logger
 
-from .canvas import ConnectionLine, WorkflowCanvas
+from .canvas import WorkflowCanvas
 from .component_palette import ComponentPalette
 from .property_editor import PropertyEditor
+from .worker import Worker
 from ..components.base import WorkflowComponent
 
+# QIcons shared by every window, keyed by resource path
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+
+def _icon(path: str) -> QIcon:
+    """Return the shared icon for a resource path, loading it once."""
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -28,6 +44,12 @@ class MainWindow(QMainWindow):
         self.canvas = None
         self.component_palette = None
         self.property_editor = None
+        self._io_workers = set()  # Keeps running file workers alive
+        self._last_title = ""
+        self._save_in_flight = False  # A background save worker is running
+        self._queued_save: Optional[str] = None  # Save requested meanwhile
+        self._save_written = threading.Event()  # Clear while a background write runs
+        self._save_written.set()
         
         # Initialize UI components
         self.settings = QSettings('YourCompany', 'DataMiningApp')
@@ -63,12 +85,11 @@ class MainWindow(QMainWindow):
             self.component_palette = ComponentPalette(self)
             self.addDockWidget(Qt.LeftDockWidgetArea, self.component_palette)
             
-            # Property editor
-            self.property_editor = PropertyEditor(self)
-            self.addDockWidget(Qt.RightDockWidgetArea, self.property_editor)
+            # Property editor is built on first selection
             
             # Connect signals - make sure types match!
-            self.canvas.component_selected.connect(self.property_editor.set_component)
+            self.canvas.component_selected.connect(self._ensure_property_editor)
+            self.canvas.cleared.connect(self._on_canvas_cleared)
             self.canvas.status_message.connect(self.statusBar().showMessage)
             self.component_palette.component_created.connect(self.canvas.add_component)
             
@@ -76,6 +97,18 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Failed to create dock widgets: {str(e)}")
             raise
 
+    def _ensure_property_editor(self, component: WorkflowComponent):
+        """Create the property editor dock on first use and show the component."""
+        if self.property_editor is None:
+            self.property_editor = PropertyEditor(self)
+            self.addDockWidget(Qt.RightDockWidgetArea, self.property_editor)
+        self.property_editor.set_component(component)
+
+    def _on_canvas_cleared(self):
+        """Stop editing a component the canvas is about to delete."""
+        if self.property_editor is not None:
+            self.property_editor.set_component(None)
+
     def update_window_title(self):
         """Update window title with modification status."""
         title = "Data Mining Workflow Designer"
@@ -83,6 +116,10 @@ class MainWindow(QMainWindow):
             title += f" - {Path(self.current_file).name}"
         if self.canvas and self.canvas.modified:  # Use the property instead of the method
             title += " *"
+        # Runs on every modified_changed; skip the window-manager call if unchanged
+        if title == self._last_title:
+            return
+        self._last_title = title
         self.setWindowTitle(title)
 
     def create_toolbar(self):
@@ -100,7 +137,7 @@ class MainWindow(QMainWindow):
         ]
         
         for name, icon, handler in actions:
-            action = QAction(QIcon(icon), name, self)
+            action = QAction(_icon(icon), name, self)
             action.triggered.connect(handler)
             toolbar.addAction(action)
             
@@ -165,43 +202,175 @@ class MainWindow(QMainWindow):
         if not filename:
             filename, _ = QFileDialog.getOpenFileName(
                 self, "Open Workflow",
-                str(Path.home()),
-                "Workflow Files (*.workflow);;All Files (*)"
+                self._last_dir(),
+                "Workflow Files (*.workflow);;All Files (*)",
+                options=self._file_dialog_options()
             )
+            self._remember_dir(filename)
         if filename and self.canvas:
-            if self.canvas.load_from_file(filename):
-                self.current_file = filename
-                self.update_window_title()
+            # Parse off the GUI thread; only building the scene happens here
+            self._run_in_background(
+                f"Opening {Path(filename).name}...",
+                WorkflowCanvas.read_workflow_file, filename,
+                on_done=lambda workflow_data: self._finish_open(filename, workflow_data),
+                on_error=lambda message: self._report_io_error("open", message))
                 
-    def save_workflow(self, filename=None):
-        """Save current workflow."""
+    def _finish_open(self, filename: str, workflow_data: dict):
+        """Build the loaded workflow on the canvas."""
+        if self.canvas.load_workflow_data(workflow_data):
+            self.current_file = filename
+            self.update_window_title()
+            
+    def save_workflow(self, filename=None, background: bool = True,
+                      on_saved: Optional[Callable[[], None]] = None):
+        """Save current workflow.
+        
+        With background set, the file is written on a worker thread and
+        True means the save was started; on_saved runs once it completes.
+        A background save with on_saved set shows no progress dialog.
+        Only one background save runs at a time; a save requested while
+        one is running is queued and starts when it finishes.
+        """
         if not filename and not self.current_file:
             return self.save_workflow_as()
             
         filename = filename or self.current_file
         if filename and self.canvas:
-            if self.canvas.save_to_file(filename):
-                self.current_file = filename
-                self.update_window_title()
+            if not background:
+                if self._save_in_flight:
+                    # Let the running write land first so this one wins
+                    self._save_written.wait()
+                if self.canvas.save_to_file(filename):
+                    self._finish_save(filename)
+                    return True
+                return False
+            
+            if self._save_in_flight:
+                self._queued_save = filename
                 return True
+            
+            # Snapshot on the GUI thread, write on a worker
+            components, connections = self.canvas.encode_workflow()
+            self.canvas.modified = False
+            self._save_in_flight = True
+            self._save_written.clear()
+            
+            def write(*args):
+                try:
+                    WorkflowCanvas.write_workflow_file(*args)
+                finally:
+                    self._save_written.set()
+            
+            def done(_):
+                self._end_background_save()
+                self._finish_save(filename)
+                if on_saved:
+                    on_saved()
+                    
+            def failed(message):
+                self._end_background_save()
+                self._on_save_failed(message)
+                    
+            self._run_in_background(
+                None if on_saved else "Saving workflow...",
+                write, filename, components, connections,
+                on_done=done,
+                on_error=failed)
+            return True
         return False
         
-    def save_workflow_as(self):
-        """Save workflow with a new filename."""
+    def _end_background_save(self):
+        """Clear the in-flight save and start a save queued behind it."""
+        self._save_in_flight = False
+        queued, self._queued_save = self._queued_save, None
+        if queued:
+            # Deferred so the finishing save's callbacks run first
+            QTimer.singleShot(0, lambda: self.save_workflow(queued))
+        
+    def _finish_save(self, filename: str):
+        """Record the file a save completed to."""
+        self.current_file = filename
+        self.update_window_title()
+        
+    def _on_save_failed(self, message: str):
+        """Keep the workflow marked unsaved when a background save fails."""
+        if self.canvas:
+            self.canvas.modified = True
+        self._report_io_error("save", message)
+        
+    def _ask_save_filename(self) -> Optional[str]:
+        """Prompt for the file to save the workflow to."""
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Workflow As",
-            str(Path.home()),
-            "Workflow Files (*.workflow);;All Files (*)"
+            self._last_dir(),
+            "Workflow Files (*.workflow);;All Files (*)",
+            options=self._file_dialog_options()
         )
+        self._remember_dir(filename)
+        return filename or None
+        
+    @staticmethod
+    def _file_dialog_options() -> QFileDialog.Options:
+        """File dialog options for the current desktop."""
+        options = QFileDialog.Options()
+        # KDE's native picker can take tens of seconds to enumerate slow homes
+        if sys.platform.startswith('linux') and 'KDE' in os.environ.get('XDG_CURRENT_DESKTOP', '').upper():
+            options |= QFileDialog.DontUseNativeDialog
+        return options
+        
+    def _last_dir(self) -> str:
+        """Directory the last file dialog ended in."""
+        return self.settings.value('last_dir', str(Path.home()))
+        
+    def _remember_dir(self, filename: str):
+        """Start the next file dialog where this one ended."""
+        if filename:
+            self.settings.setValue('last_dir', str(Path(filename).parent))
+        
+    def save_workflow_as(self):
+        """Save workflow with a new filename."""
+        filename = self._ask_save_filename()
         if filename:
             return self.save_workflow(filename)
         return False
         
+    def _run_in_background(self, label: Optional[str], fn: Callable[..., Any], *args,
+                           on_done: Callable[[Any], None], on_error: Callable[[str], None]):
+        """Run file I/O on the global thread pool behind a progress dialog.
+        
+        A label of None runs the job without a dialog.
+        """
+        progress = None
+        if label is not None:
+            progress = QProgressDialog(label, None, 0, 0, self)
+            progress.setWindowModality(Qt.WindowModal)
+            progress.setMinimumDuration(500)
+        
+        worker = Worker(fn, *args)
+        self._io_workers.add(worker)
+        
+        def finish():
+            if progress is not None:
+                progress.close()
+            self._io_workers.discard(worker)
+            
+        worker.signals.finished.connect(lambda result: (finish(), on_done(result)))
+        worker.signals.error.connect(lambda message: (finish(), on_error(message)))
+        QThreadPool.globalInstance().start(worker)
+        
+    def _report_io_error(self, action: str, message: str):
+        """Log and show a failed file operation."""
+        self.logger.error(f"Failed to {action} workflow: {message}")
+        QMessageBox.critical(self, "File Error", f"Failed to {action} workflow:\n{message}")
+        
     def autosave(self):
         """Perform autosave if needed."""
-        if self.current_file and self.canvas and self.canvas.is_modified():
-            self.save_workflow(self.current_file)
-            self.status_bar.showMessage("Autosaved", 2000)
+        if self._save_in_flight or not (self.current_file and self.canvas and self.canvas.is_modified()):
+            return
+        # Write quietly and only report once the file is on disk
+        self.save_workflow(
+            self.current_file,
+            on_saved=lambda: self.status_bar.showMessage("Autosaved", 2000))
             
     def check_unsaved_changes(self) -> bool:
         """Check for unsaved changes."""
@@ -223,15 +392,6 @@ class MainWindow(QMainWindow):
         if geometry:
             self.restoreGeometry(geometry)
             
-    def update_window_title(self):
-        """Update window title."""
-        title = "Data Mining Workflow Designer"
-        if self.current_file:
-            title += f" - {Path(self.current_file).name}"
-        if self.canvas and self.canvas.is_modified():
-            title += " *"
-        self.setWindowTitle(title)
-        
     def closeEvent(self, event):
         """Handle application close."""
         if self.check_unsaved_changes():
@@ -251,7 +411,9 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.Save:
-                return self.save_workflow()
+                # The caller may close right after, so write before returning
+                filename = self.current_file or self._ask_save_filename()
+                return bool(filename) and self.save_workflow(filename, background=False)
             elif reply == QMessageBox.Cancel:
                 return False
                 
@@ -270,124 +432,3 @@ class MainWindow(QMainWindow):
         """Delete selected items on the canvas."""
         if self.canvas:
             self.canvas.delete_selected_items()
-
-    def save_to_file(self, filename: str) -> bool:
-        """Save the workflow to a file."""
-        try:
-            print("Canvas: Saving workflow to file...")
-            
-            # Create workflow data structure
-            workflow_data = {
-                'components': {},
-                'connections': []
-            }
-            
-            # Save components
-            for comp_id, component in self.components.items():
-                print(f"Canvas: Saving component {component.title}")
-                component_data = {
-                    'type': component.__class__.__name__,
-                    'position': {
-                        'x': component.pos().x(),
-                        'y': component.pos().y()
-                    },
-                    'properties': component.properties,
-                    'id': comp_id
-                }
-                workflow_data['components'][comp_id] = component_data
-
-            # Save connections
-            for connection in self.connections:
-                print("Canvas: Saving connection")
-                connection_data = {
-                    'source': {
-                        'component': connection.start_port.parent().id,
-                        'port': connection.start_port.name
-                    },
-                    'target': {
-                        'component': connection.end_port.parent().id,
-                        'port': connection.end_port.name
-                    }
-                }
-                workflow_data['connections'].append(connection_data)
-
-            # Save to file
-            import json
-            with open(filename, 'w') as f:
-                json.dump(workflow_data, f, indent=4)
-                
-            print(f"Canvas: Workflow saved successfully to {filename}")
-            self.modified = False  # Reset modified flag
-            return True
-
-        except Exception as e:
-            print(f"Canvas ERROR in save_to_file: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False
-
-    def load_from_file(self, filename: str) -> bool:
-        """Load workflow from a file."""
-        try:
-            print(f"Canvas: Loading workflow from {filename}")
-            
-            # Clear current workflow
-            self.clear(save_state=False)
-            
-            # Load file
-            import json
-            with open(filename, 'r') as f:
-                workflow_data = json.load(f)
-                
-            # Create components
-            for comp_id, comp_data in workflow_data['components'].items():
-                print(f"Canvas: Creating component of type {comp_data['type']}")
-                
-                # Create component instance
-                component = self.create_component({'type': comp_data['type']})
-                if component:
-                    # Set component ID and position
-                    component.id = comp_id
-                    component.setPos(
-                        comp_data['position']['x'],
-                        comp_data['position']['y']
-                    )
-                    
-                    # Set properties
-                    if 'properties' in comp_data:
-                        component.properties = comp_data['properties']
-                    
-                    # Add to canvas
-                    self.add_component(component, save_state=False)
-
-            # Create connections
-            for conn_data in workflow_data['connections']:
-                print("Canvas: Restoring connection")
-                try:
-                    # Get source component and port
-                    source_comp = self.components[conn_data['source']['component']]
-                    source_port = source_comp.output_ports[conn_data['source']['port']]
-                    
-                    # Get target component and port
-                    target_comp = self.components[conn_data['target']['component']]
-                    target_port = target_comp.input_ports[conn_data['target']['port']]
-                    
-                    # Create connection
-                    connection = ConnectionLine(source_port, target_port)
-                    self.scene.addItem(connection)
-                    self.connections.add(connection)
-                    connection.update_position()
-                    
-                except Exception as e:
-                    print(f"Canvas ERROR: Failed to restore connection: {str(e)}")
-                    continue
-
-            self.modified = False
-            print("Canvas: Workflow loaded successfully")
-            return True
-
-        except Exception as e:
-            print(f"Canvas ERROR in load_from_file: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return False
\ No newline at end of file
@@ -1,95 +1,113 @@
 # frontend/src/ui/property_editor.py
-from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QFormLayout,
+from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout,
                            QLabel, QLineEdit, QSpinBox, QDoubleSpinBox,
                            QComboBox, QCheckBox, QPushButton, QFileDialog,
-                           QScrollArea, QGroupBox, QHBoxLayout)
-from PyQt5.QtCore import Qt, pyqtSlot
+                           QScrollArea, QGroupBox, QHBoxLayout, QGridLayout)
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 from typing import Optional, Dict, Any
+from collections import defaultdict
+from functools import partial
+from weakref import WeakValueDictionary
 import logging
 
 from src.frontend.components.base import WorkflowComponent
 
+def _make_string(value: Any, callback, prop_info: dict) -> QWidget:
+    """Create a line edit for string values."""
+    widget = QLineEdit()
+    widget.setText(str(value))
+    # Commit on Enter or focus-out rather than on every keystroke
+    widget.editingFinished.connect(lambda w=widget: callback(w.text()))
+    return widget
+
+def _make_number(value: Any, callback, prop_info: dict) -> QWidget:
+    """Create a spin box for floating-point values."""
+    widget = QDoubleSpinBox()
+    widget.setRange(-999999, 999999)
+    widget.setDecimals(4)
+    widget.setValue(float(value))
+    widget.valueChanged.connect(callback)
+    return widget
+
+def _make_integer(value: Any, callback, prop_info: dict) -> QWidget:
+    """Create a spin box for integer values."""
+    widget = QSpinBox()
+    widget.setRange(-999999, 999999)
+    widget.setValue(int(value))
+    widget.valueChanged.connect(callback)
+    return widget
+
+def _make_boolean(value: Any, callback, prop_info: dict) -> QWidget:
+    """Create a check box for boolean values."""
+    widget = QCheckBox()
+    widget.setChecked(bool(value))
+    widget.stateChanged.connect(lambda v: callback(bool(v)))
+    return widget
+
+def _make_choice(value: Any, callback, prop_info: dict) -> QWidget:
+    """Create a combo box from a {"choices", "selected"} value."""
+    widget = QComboBox()
+    if isinstance(value, dict):
+        widget.addItems(value.get("choices", []))
+        widget.setCurrentText(value.get("selected", ""))
+    widget.currentTextChanged.connect(callback)
+    return widget
+
+def _make_file(value: str, callback, prop_info: dict) -> QWidget:
+    """Create a file selection widget with preview."""
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    layout.setContentsMargins(0, 0, 0, 0)
+
+    # File selection row
+    file_row = QWidget()
+    file_layout = QHBoxLayout(file_row)
+    file_layout.setContentsMargins(0, 0, 0, 0)
+
+    # Path display
+    path_edit = QLineEdit()
+    path_edit.setText(str(value or ""))
+    path_edit.setReadOnly(True)
+    file_layout.addWidget(path_edit)
+
+    # Browse button
+    browse_button = QPushButton("Browse...")
+    file_layout.addWidget(browse_button)
+    layout.addWidget(file_row)
+
+    def handle_browse():
+        filters = (prop_info or {}).get("filters", "All Files (*.*)")
+        filename, _ = QFileDialog.getOpenFileName(
+            container.window(),
+            "Select File",
+            str(value or ""),
+            filters
+        )
+        if filename:
+            path_edit.setText(filename)
+            callback(filename)
+
+    browse_button.clicked.connect(handle_browse)
+    return container
+
 class PropertyWidget:
     """Factory for creating property widgets based on type."""
     
-    @staticmethod
-    def create_widget(prop_type: str, value: Any, callback, prop_info: dict = None) -> Optional[QWidget]:
+    # New property types register a builder here
+    _FACTORIES = {
+        "string": _make_string,
+        "number": _make_number,
+        "integer": _make_integer,
+        "boolean": _make_boolean,
+        "choice": _make_choice,
+        "file": _make_file,
+    }
+    
+    @classmethod
+    def create_widget(cls, prop_type: str, value: Any, callback, prop_info: dict = None) -> Optional[QWidget]:
         """Create an appropriate widget for the property type."""
-        if prop_type == "file":
-            return PropertyWidget._create_file_widget(value, callback, prop_info)
-            
-        elif prop_type == "string":
-            widget = QLineEdit()
-            widget.setText(str(value))
-            widget.textChanged.connect(callback)
-            
-        elif prop_type == "number":
-            widget = QDoubleSpinBox()
-            widget.setRange(-999999, 999999)
-            widget.setDecimals(4)
-            widget.setValue(float(value))
-            widget.valueChanged.connect(callback)
-            
-        elif prop_type == "integer":
-            widget = QSpinBox()
-            widget.setRange(-999999, 999999)
-            widget.setValue(int(value))
-            widget.valueChanged.connect(callback)
-            
-        elif prop_type == "boolean":
-            widget = QCheckBox()
-            widget.setChecked(bool(value))
-            widget.stateChanged.connect(lambda v: callback(bool(v)))
-            
-        elif prop_type == "choice":
-            widget = QComboBox()
-            if isinstance(value, dict):
-                widget.addItems(value.get("choices", []))
-                widget.setCurrentText(value.get("selected", ""))
-            widget.currentTextChanged.connect(callback)
-            
-        else:
-            return None
-            
-        return widget
-
-    @staticmethod
-    def _create_file_widget(value: str, callback, prop_info: dict) -> QWidget:
-        """Create a file selection widget with preview."""
-        container = QWidget()
-        layout = QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        # File selection row
-        file_row = QWidget()
-        file_layout = QHBoxLayout(file_row)
-        file_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Path display
-        path_edit = QLineEdit()
-        path_edit.setText(str(value or ""))
-        path_edit.setReadOnly(True)
-        file_layout.addWidget(path_edit)
-
-        # Browse button
-        browse_button = QPushButton("Browse...")
-        file_layout.addWidget(browse_button)
-        layout.addWidget(file_row)
-
-        def handle_browse():
-            filters = prop_info.get("filters", "All Files (*.*)")
-            filename, _ = QFileDialog.getOpenFileName(
-                container.window(),
-                "Select File",
-                str(value or ""),
-                filters
-            )
-            if filename:
-                path_edit.setText(filename)
-                callback(filename)
-
-        browse_button.clicked.connect(handle_browse)
-        return container
+        factory = cls._FACTORIES.get(prop_type)
+        return factory(value, callback, prop_info) if factory else None
 
 class PropertyEditor(QDockWidget):
     """Property editor dock widget."""
@@ -101,54 +119,80 @@ class PropertyEditor(QDockWidget):
         # Create scroll area
         self.setMinimumWidth(300)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._scroll = QScrollArea()
+        self._scroll.setWidgetResizable(True)
+        self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        
+        self._build_form()
+        self.setWidget(self._scroll)
+        
+        # Component state
+        self.current_component: Optional[WorkflowComponent] = None
+        # Weak so editors vanish with the form that owns them
+        self.widgets: Dict[str, QWidget] = WeakValueDictionary()
+        self._props_cache: Optional[Dict[str, Any]] = None
+        
+        # Collapse bursts of edits (spin box drags, typing) into one repaint
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._flush_component_update)
         
+    def _build_form(self):
+        """Create an empty property form and show it in the scroll area."""
         # Create main widget and layout
         self.main_widget = QWidget()
         self.main_layout = QVBoxLayout(self.main_widget)
         self.main_layout.setContentsMargins(8, 8, 8, 8)
         self.main_layout.setSpacing(8)
         
-        # Create form layout for properties
-        self.form_layout = QFormLayout()
+        # Create form layout for properties; a grid places each row in
+        # constant time where QFormLayout re-measures every label
+        self.form_layout = self._new_grid()
         self.main_layout.addLayout(self.form_layout)
         self.main_layout.addStretch()
         
-        scroll.setWidget(self.main_widget)
-        self.setWidget(scroll)
+        # The scroll area deletes the previous form and all its rows
+        self._scroll.setWidget(self.main_widget)
         
-        # Component state
-        self.current_component: Optional[WorkflowComponent] = None
-        self.widgets: Dict[str, QWidget] = {}
+    @staticmethod
+    def _new_grid() -> QGridLayout:
+        """Create a two-column label/widget grid."""
+        layout = QGridLayout()
+        layout.setColumnStretch(1, 1)
+        return layout
         
     @pyqtSlot(WorkflowComponent)
     def set_component(self, component: Optional[WorkflowComponent]):
         """Set the component to edit and update the property panel."""
-        self.current_component = component
-        self.clear_properties()
-        
-        if component:
-            # Add component type header
-            header = QLabel(f"<b>{component.__class__.__name__}</b>")
-            self.form_layout.addRow(header)
-            
-            # Create property groups
-            properties = component.get_properties()
-            grouped_props = self._group_properties(properties)
+        # Lay out and paint once after all rows are in, not once per row
+        self.setUpdatesEnabled(False)
+        try:
+            self.current_component = component
+            self.clear_properties()
             
-            for group_name, group_props in grouped_props.items():
-                if len(grouped_props) > 1:  # Only create groups if there are multiple
-                    group_box = QGroupBox(group_name)
-                    group_layout = QFormLayout()
-                    self._add_properties_to_layout(group_props, group_layout)
-                    group_box.setLayout(group_layout)
-                    self.form_layout.addRow(group_box)
-                else:
-                    self._add_properties_to_layout(group_props, self.form_layout)
+            if component:
+                # Add component type header
+                header = QLabel(f"<b>{component.__class__.__name__}</b>")
+                self.form_layout.addWidget(header, self.form_layout.rowCount(), 0, 1, 2)
+                
+                # Create property groups
+                properties = self._props_cache = component.get_properties()
+                grouped_props = self._group_properties(properties)
+                
+                for group_name, group_props in grouped_props.items():
+                    if len(grouped_props) > 1:  # Only create groups if there are multiple
+                        group_box = QGroupBox(group_name)
+                        group_layout = self._new_grid()
+                        self._add_properties_to_layout(group_props, group_layout)
+                        group_box.setLayout(group_layout)
+                        self.form_layout.addWidget(group_box, self.form_layout.rowCount(), 0, 1, 2)
+                    else:
+                        self._add_properties_to_layout(group_props, self.form_layout)
+        finally:
+            self.setUpdatesEnabled(True)
 
-    def _add_properties_to_layout(self, properties: Dict[str, Any], layout: QFormLayout):
+    def _add_properties_to_layout(self, properties: Dict[str, Any], layout: QGridLayout):
         """Add properties to the specified layout."""
         for prop_name, prop_info in properties.items():
             label = QLabel(prop_info.get("label", prop_name))
@@ -157,41 +201,43 @@ class PropertyEditor(QDockWidget):
             widget = PropertyWidget.create_widget(
                 prop_info.get("type", "string"),
                 prop_info.get("value"),
-                lambda v, name=prop_name: self._on_property_changed(name, v),
+                partial(self._on_property_changed, prop_name),
                 prop_info
             )
             
             if widget:
-                layout.addRow(label, widget)
+                row = layout.rowCount()
+                layout.addWidget(label, row, 0)
+                layout.addWidget(widget, row, 1)
                 self.widgets[prop_name] = widget
 
     def _group_properties(self, properties: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """Group properties by their group attribute."""
-        grouped = {}
+        grouped = defaultdict(dict)
         for name, info in properties.items():
-            group = info.get("group", "General")
-            if group not in grouped:
-                grouped[group] = {}
-            grouped[group][name] = info
-        return grouped
+            grouped[info.get("group", "General")][name] = info
+        return dict(grouped)
 
     def _on_property_changed(self, name: str, value: Any):
         """Handle property value changes."""
-        if self.current_component:
-            properties = self.current_component.get_properties()
+        properties = self._props_cache
+        if self.current_component and properties is not None:
             if name in properties:
                 if properties[name]["type"] == "choice":
                     properties[name]["value"]["selected"] = value
                 else:
                     properties[name]["value"] = value
 
-                if hasattr(self.current_component, 'update'):
-                    self.current_component.update()
+                self._update_timer.start()
+
+    def _flush_component_update(self):
+        """Repaint the edited component once edits have settled."""
+        if self.current_component and hasattr(self.current_component, 'update'):
+            self.current_component.update()
 
     def clear_properties(self):
         """Clear all property widgets."""
-        while self.form_layout.count():
-            item = self.form_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self.widgets.clear()
\ No newline at end of file
+        # Swapping in a fresh form drops the old widget tree in one pass,
+        # including rows nested inside group boxes
+        self._build_form()
+        self._props_cache = None
\ No newline at end of file
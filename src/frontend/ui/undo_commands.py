@@ -0,0 +1,88 @@
+# src/frontend/ui/undo_commands.py
+from dataclasses import dataclass, field
+from typing import List, TYPE_CHECKING
+
+from PyQt5.QtCore import QPointF
+
+if TYPE_CHECKING:
+    from src.frontend.components.base import WorkflowComponent
+    from .canvas import ConnectionLine, WorkflowCanvas
+
+
+@dataclass
+class AddComponentCmd:
+    """Undoable addition of a component to the canvas."""
+    component: 'WorkflowComponent'
+
+    def do(self, canvas: 'WorkflowCanvas'):
+        canvas.add_component(self.component, save_state=False)
+
+    def undo(self, canvas: 'WorkflowCanvas'):
+        canvas.remove_component(self.component)
+
+
+@dataclass
+class RemoveComponentCmd:
+    """Undoable removal of a component together with its connections."""
+    component: 'WorkflowComponent'
+    connections: List['ConnectionLine'] = field(default_factory=list)
+
+    def do(self, canvas: 'WorkflowCanvas'):
+        canvas.remove_component(self.component)
+
+    def undo(self, canvas: 'WorkflowCanvas'):
+        canvas.add_component(self.component, save_state=False)
+        for connection in self.connections:
+            canvas.attach_connection(connection)
+
+
+@dataclass
+class AddConnectionCmd:
+    """Undoable creation of a connection."""
+    connection: 'ConnectionLine'
+
+    def do(self, canvas: 'WorkflowCanvas'):
+        canvas.attach_connection(self.connection)
+
+    def undo(self, canvas: 'WorkflowCanvas'):
+        canvas.remove_connection(self.connection)
+
+
+@dataclass
+class RemoveConnectionCmd:
+    """Undoable removal of a connection."""
+    connection: 'ConnectionLine'
+
+    def do(self, canvas: 'WorkflowCanvas'):
+        canvas.remove_connection(self.connection)
+
+    def undo(self, canvas: 'WorkflowCanvas'):
+        canvas.attach_connection(self.connection)
+
+
+@dataclass
+class MoveComponentCmd:
+    """Undoable move of a component between two positions."""
+    component: 'WorkflowComponent'
+    old_pos: QPointF
+    new_pos: QPointF
+
+    def do(self, canvas: 'WorkflowCanvas'):
+        self.component.setPos(self.new_pos)
+
+    def undo(self, canvas: 'WorkflowCanvas'):
+        self.component.setPos(self.old_pos)
+
+
+@dataclass
+class MacroCmd:
+    """Several commands undone and redone as a single step."""
+    commands: List = field(default_factory=list)
+
+    def do(self, canvas: 'WorkflowCanvas'):
+        for command in self.commands:
+            command.do(canvas)
+
+    def undo(self, canvas: 'WorkflowCanvas'):
+        for command in reversed(self.commands):
+            command.undo(canvas)
@@ -0,0 +1,33 @@
+# src/frontend/ui/worker.py
+from typing import Any, Callable
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signals a Worker emits back to the GUI thread."""
+    finished = pyqtSignal(object)  # Return value of the wrapped callable
+    error = pyqtSignal(str)
+
+
+class Worker(QRunnable):
+    """Run a callable on a QThreadPool thread and report the outcome.
+
+    The callable must not touch widgets; results reach the GUI thread
+    through the queued ``finished``/``error`` signals.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
@@ -1,22 +1,49 @@
+import copy
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from PyQt5.QtCore import QCoreApplication, QTimer
 from src.frontend.utils.logger import get_logger
 
 class ConfigManager:
     """Manage application configuration."""
     
+    # Milliseconds to wait for further set() calls before writing
+    SAVE_DELAY = 500
+    
+    # Parsed config per file, keyed on its mtime so unchanged files skip the parse
+    _CACHE: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+    
     def __init__(self, config_file: str = "config.json"):
         self.config_file = Path(config_file)
         self.logger = get_logger(__name__)
         self.config: Dict[str, Any] = self.load_config()
         
+        # Coalesce bursts of set() calls into one write
+        self._dirty = False
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+        
+        # A pending write must not be lost when the app quits inside SAVE_DELAY
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+        
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         if self.config_file.exists():
             try:
+                mtime = self.config_file.stat().st_mtime_ns
+                cached = ConfigManager._CACHE.get(self.config_file)
+                if cached and cached[0] == mtime:
+                    return copy.deepcopy(cached[1])
                 with open(self.config_file, 'r') as f:
-                    return json.load(f)
+                    config = json.load(f)
+                ConfigManager._CACHE[self.config_file] = (mtime, config)
+                # Instances get their own copy so nested edits never reach the cache
+                return copy.deepcopy(config)
             except Exception as e:
                 self.logger.error(f"Failed to load config: {str(e)}")
         return self._default_config()
@@ -25,8 +52,14 @@ class ConfigManager:
         """Save current configuration to file."""
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
+            # Write a sibling file and swap it in so a crash never leaves half a config
+            tmp_file = self.config_file.with_suffix(self.config_file.suffix + '.tmp')
+            with open(tmp_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            os.replace(tmp_file, self.config_file)
+            ConfigManager._CACHE[self.config_file] = (
+                self.config_file.stat().st_mtime_ns, copy.deepcopy(self.config))
+            self._dirty = False
             return True
         except Exception as e:
             self.logger.error(f"Failed to save config: {str(e)}")
@@ -37,9 +70,23 @@ class ConfigManager:
         return self.config.get(key, default)
         
     def set(self, key: str, value: Any):
-        """Set configuration value."""
+        """Set configuration value; the file is written shortly after."""
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
-        self.save_config()
+        self._dirty = True
+        if QCoreApplication.instance() is None:
+            # No event loop to fire the timer; write through
+            self.save_config()
+            return
+        self._flush_timer.start(self.SAVE_DELAY)
+        
+    def flush(self) -> bool:
+        """Write pending changes to disk now."""
+        self._flush_timer.stop()
+        if not self._dirty:
+            return True
+        return self.save_config()
         
     def _default_config(self) -> Dict[str, Any]:
         """Create default configuration."""
@@ -50,7 +97,7 @@ class ConfigManager:
             "auto_save_interval": 300,  # 5 minutes
             "theme": "light",
             "component_snap_to_grid": True,
-            "grid_size": 20,
+            "grid_size": 16,
             "default_save_dir": str(Path.home()),
             "window": {
                 "geometry": None,
@@ -1,10 +1,19 @@
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Drains the log queue into the real handlers on a background thread
+_listener = None
 
 def setup_logging():
     """Configure logging for the application."""
+    global _listener
+    if _listener is not None:
+        return
+    
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -28,11 +37,28 @@ def setup_logging():
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.INFO)
     
+    # Callers only enqueue records; file and console I/O happen on the
+    # listener thread so logging never blocks the GUI
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue, file_handler, console_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    # Drain whatever is still queued when the interpreter exits
+    atexit.register(stop_logging)
+    
     # Setup root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+def stop_logging():
+    """Flush queued log records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name."""
@@ -1,226 +1,286 @@
 # frontend/src/utils/style.py
-from PyQt5.QtGui import QPalette, QColor
-from PyQt5.QtCore import Qt
-from typing import Dict, Any
+from PyQt5.QtGui import QPalette, QColor, QBrush
+from PyQt5.QtCore import Qt, QFile
+from functools import lru_cache
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, NamedTuple, Optional
 
-def set_dark_theme(app) -> None:
-    """Apply dark theme to the application."""
-    palette = QPalette()
+from src.frontend.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Theme stylesheets ship as .qss files and are read on first use
+_THEMES_DIR = Path(__file__).resolve().parent.parent / "resources" / "themes"
+_QSS_CACHE: Dict[str, str] = {}
+
+try:
+    # Generated from resources/themes.qrc by pyrcc5; registers :/themes
+    from src.frontend.resources import themes_rc  # noqa: F401
+    _QSS_ROOT = ":/themes"
+except ImportError:
+    # Not compiled; read the .qss files from the source tree
+    _QSS_ROOT = str(_THEMES_DIR)
+
+def _read_qss(name: str) -> str:
+    """Read a theme stylesheet, reusing the text after the first read."""
+    sheet = _QSS_CACHE.get(name)
+    if sheet is None:
+        qss_file = QFile(f"{_QSS_ROOT}/{name}.qss")
+        if qss_file.open(QFile.ReadOnly | QFile.Text):
+            try:
+                sheet = bytes(qss_file.readAll()).decode("utf-8")
+            finally:
+                qss_file.close()
+        else:
+            # Missing files leave Qt's default look rather than failing startup;
+            # the miss is not cached so a restored file is picked up on reapply
+            logger.warning("Stylesheet %s.qss not found under %s", name, _QSS_ROOT)
+            return ""
+        _QSS_CACHE[name] = sheet
+    return sheet
+
+_PX = re.compile(r"(\d+)px")
+
+@lru_cache(maxsize=4)
+def _theme_stylesheet(theme: str, scale: float = 1.0) -> str:
+    """Complete stylesheet for a theme, so a switch replaces the sheet in one call.
     
+    Built sheets are cached per (theme, scale); see invalidate_theme_cache.
+    """
+    # Colours are baked in here rather than resolved through palette() per widget
+    sheet = (_read_qss("base") + _read_qss("theme")) % get_theme_colors(theme)
+    if scale != 1.0:
+        sheet = _PX.sub(lambda m: f"{round(int(m.group(1)) * scale)}px", sheet)
+    return sheet
+
+def invalidate_theme_cache() -> None:
+    """Drop built stylesheets and colours so the next apply picks up changes."""
+    global _active_theme
+    _QSS_CACHE.clear()
+    _theme_stylesheet.cache_clear()
+    _THEME_QCOLORS.clear()
+    _active_theme = None
+
+# Integer RGB constructors skip QColor's colour-name parser
+_DARK_PALETTE_COLORS = (
     # Base colors
-    palette.setColor(QPalette.Window, QColor("#1a1a1a"))
-    palette.setColor(QPalette.WindowText, QColor("#ffffff"))
-    palette.setColor(QPalette.Base, QColor("#2d2d2d"))
-    palette.setColor(QPalette.AlternateBase, QColor("#353535"))
-    palette.setColor(QPalette.PlaceholderText, QColor("#8a8a8a"))
+    (QPalette.Window, QColor(0x1a, 0x1a, 0x1a)),
+    (QPalette.WindowText, QColor(0xff, 0xff, 0xff)),
+    (QPalette.Base, QColor(0x2d, 0x2d, 0x2d)),
+    (QPalette.AlternateBase, QColor(0x35, 0x35, 0x35)),
+    (QPalette.PlaceholderText, QColor(0x8a, 0x8a, 0x8a)),
     
     # Text colors
-    palette.setColor(QPalette.Text, QColor("#ffffff"))
-    palette.setColor(QPalette.BrightText, QColor("#ffffff"))
+    (QPalette.Text, QColor(0xff, 0xff, 0xff)),
+    (QPalette.BrightText, QColor(0xff, 0xff, 0xff)),
     
     # Button colors
-    palette.setColor(QPalette.Button, QColor("#353535"))
-    palette.setColor(QPalette.ButtonText, QColor("#ffffff"))
+    (QPalette.Button, QColor(0x35, 0x35, 0x35)),
+    (QPalette.ButtonText, QColor(0xff, 0xff, 0xff)),
     
     # Link colors
-    palette.setColor(QPalette.Link, QColor("#3d8ec9"))
-    palette.setColor(QPalette.LinkVisited, QColor("#287399"))
+    (QPalette.Link, QColor(0x3d, 0x8e, 0xc9)),
+    (QPalette.LinkVisited, QColor(0x28, 0x73, 0x99)),
     
     # Selection colors
-    palette.setColor(QPalette.Highlight, QColor("#2d5c76"))
-    palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
+    (QPalette.Highlight, QColor(0x2d, 0x5c, 0x76)),
+    (QPalette.HighlightedText, QColor(0xff, 0xff, 0xff)),
     
     # Tooltip colors
-    palette.setColor(QPalette.ToolTipBase, QColor("#353535"))
-    palette.setColor(QPalette.ToolTipText, QColor("#ffffff"))
-    
-    app.setPalette(palette)
-    apply_dark_stylesheet(app)
+    (QPalette.ToolTipBase, QColor(0x35, 0x35, 0x35)),
+    (QPalette.ToolTipText, QColor(0xff, 0xff, 0xff)),
+)
 
-def set_light_theme(app) -> None:
-    """Apply light theme to the application."""
-    palette = QPalette()
-    
+_LIGHT_PALETTE_COLORS = (
     # Base colors
-    palette.setColor(QPalette.Window, QColor("#f5f5f5"))
-    palette.setColor(QPalette.WindowText, QColor("#000000"))
-    palette.setColor(QPalette.Base, QColor("#ffffff"))
-    palette.setColor(QPalette.AlternateBase, QColor("#f7f7f7"))
-    palette.setColor(QPalette.PlaceholderText, QColor("#7f7f7f"))
+    (QPalette.Window, QColor(0xf5, 0xf5, 0xf5)),
+    (QPalette.WindowText, QColor(0x00, 0x00, 0x00)),
+    (QPalette.Base, QColor(0xff, 0xff, 0xff)),
+    (QPalette.AlternateBase, QColor(0xf7, 0xf7, 0xf7)),
+    (QPalette.PlaceholderText, QColor(0x7f, 0x7f, 0x7f)),
     
     # Text colors
-    palette.setColor(QPalette.Text, QColor("#000000"))
-    palette.setColor(QPalette.BrightText, QColor("#ffffff"))
+    (QPalette.Text, QColor(0x00, 0x00, 0x00)),
+    (QPalette.BrightText, QColor(0xff, 0xff, 0xff)),
     
     # Button colors
-    palette.setColor(QPalette.Button, QColor("#e0e0e0"))
-    palette.setColor(QPalette.ButtonText, QColor("#000000"))
+    (QPalette.Button, QColor(0xe0, 0xe0, 0xe0)),
+    (QPalette.ButtonText, QColor(0x00, 0x00, 0x00)),
     
     # Link colors
-    palette.setColor(QPalette.Link, QColor("#0066cc"))
-    palette.setColor(QPalette.LinkVisited, QColor("#004c99"))
+    (QPalette.Link, QColor(0x00, 0x66, 0xcc)),
+    (QPalette.LinkVisited, QColor(0x00, 0x4c, 0x99)),
     
     # Selection colors
-    palette.setColor(QPalette.Highlight, QColor("#308cc6"))
-    palette.setColor(QPalette.HighlightedText, QColor("#ffffff"))
+    (QPalette.Highlight, QColor(0x30, 0x8c, 0xc6)),
+    (QPalette.HighlightedText, QColor(0xff, 0xff, 0xff)),
     
     # Tooltip colors
-    palette.setColor(QPalette.ToolTipBase, QColor("#ffffff"))
-    palette.setColor(QPalette.ToolTipText, QColor("#000000"))
-    
-    app.setPalette(palette)
+    (QPalette.ToolTipBase, QColor(0xff, 0xff, 0xff)),
+    (QPalette.ToolTipText, QColor(0x00, 0x00, 0x00)),
+)
+
+# Palettes are built on first use, once a QApplication exists, then reused
+_PALETTES: Dict[str, QPalette] = {}
+_COLOR_GROUPS = (QPalette.Active, QPalette.Inactive, QPalette.Disabled)
+
+def _palette(theme: str) -> QPalette:
+    """Get the shared palette for the specified theme."""
+    palette = _PALETTES.get(theme)
+    if palette is None:
+        palette = QPalette()
+        colors = _DARK_PALETTE_COLORS if theme == "dark" else _LIGHT_PALETTE_COLORS
+        for role, color in colors:
+            # One brush per role, shared by all three colour groups
+            brush = QBrush(color)
+            for group in _COLOR_GROUPS:
+                palette.setBrush(group, role, brush)
+        _PALETTES[theme] = palette
+    return palette
+
+# Theme currently applied by set_dark_theme/set_light_theme
+_active_theme: Optional[str] = None
+
+def set_dark_theme(app) -> None:
+    """Apply dark theme to the application."""
+    global _active_theme
+    if _active_theme == "dark":
+        return
+    app.setPalette(_palette("dark"))
+    apply_dark_stylesheet(app)
+    _active_theme = "dark"
+
+def set_light_theme(app) -> None:
+    """Apply light theme to the application."""
+    global _active_theme
+    if _active_theme == "light":
+        return
+    app.setPalette(_palette("light"))
     apply_light_stylesheet(app)
+    _active_theme = "light"
+
+# Last sheet handed to Qt, so it is never read back across the binding
+_current_sheet: Optional[str] = None
+
+def _set_stylesheet(app, sheet: str) -> None:
+    """Set the application stylesheet unless it is already in place."""
+    global _current_sheet
+    if sheet == _current_sheet:
+        return
+    app.setStyleSheet(sheet)
+    _current_sheet = sheet
 
-def apply_stylesheet(app) -> None:
+def apply_stylesheet(app, theme: str = "light") -> None:
     """Apply base stylesheet to the application."""
-    app.setStyleSheet("""
-        /* Main Window */
-        QMainWindow {
-            background-color: palette(window);
-        }
-        
-        /* Dock Widgets */
-        QDockWidget {
-            border: 1px solid palette(dark);
-            titlebar-close-icon: url(close.png);
-        }
-        
-        QDockWidget::title {
-            background: palette(alternate-base);
-            padding: 6px;
-        }
-        
-        /* Tool Bar */
-        QToolBar {
-            border: none;
-            background: palette(window);
-            spacing: 6px;
-            padding: 3px;
-        }
-        
-        QToolButton {
-            border: 1px solid transparent;
-            border-radius: 4px;
-            padding: 4px;
-            background: transparent;
-        }
-        
-        QToolButton:hover {
-            background-color: palette(alternate-base);
-            border: 1px solid palette(mid);
-        }
-        
-        QToolButton:pressed {
-            background-color: palette(dark);
-        }
-        
-        /* Menu Bar */
-        QMenuBar {
-            background-color: palette(window);
-            border-bottom: 1px solid palette(dark);
-        }
-        
-        QMenuBar::item {
-            padding: 4px 8px;
-            background: transparent;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: palette(highlight);
-            color: palette(highlighted-text);
-        }
-        
-        /* Status Bar */
-        QStatusBar {
-            background: palette(window);
-            border-top: 1px solid palette(dark);
-        }
-        
-        /* Scroll Areas */
-        QScrollArea {
-            border: none;
-            background: transparent;
-        }
-        
-        QScrollBar:vertical {
-            border: none;
-            background: palette(base);
-            width: 12px;
-            margin: 0px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background: palette(button);
-            border-radius: 6px;
-            min-height: 20px;
-            margin: 2px;
-        }
-        
-        QScrollBar::add-line:vertical,
-        QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-        
-        /* Graphics View */
-        QGraphicsView {
-            border: none;
-            selection-background-color: palette(highlight);
-        }
-    """)
-
-def apply_dark_stylesheet(app) -> None:
-    """Apply dark theme specific styles."""
-    additional_styles = """
-        /* Dark theme specific styles */
-        QWidget {
-            outline: none;
-        }
-        
-        QToolTip {
-            color: palette(tooltip-text);
-            background-color: palette(tooltip-base);
-            border: 1px solid palette(highlight);
-        }
+    _set_stylesheet(app, _read_qss("base") % get_theme_colors(theme))
+
+def apply_dark_stylesheet(app, scale: float = 1.0) -> None:
+    """Apply the base stylesheet with dark theme specific styles."""
+    _set_stylesheet(app, _theme_stylesheet("dark", scale))
+
+def apply_light_stylesheet(app, scale: float = 1.0) -> None:
+    """Apply the base stylesheet with light theme specific styles."""
+    _set_stylesheet(app, _theme_stylesheet("light", scale))
+
+_DARK_COLORS = {
+    "background": "#1a1a1a",
+    "foreground": "#ffffff",
+    "primary": "#3d8ec9",
+    "secondary": "#2d5c76",
+    "success": "#28a745",
+    "warning": "#ffc107",
+    "error": "#dc3545",
+    "border": "#353535",
+    # Stylesheet template values; dark and mid are the Qt-derived shades of
+    # button and only reach the QSS, the palette leaves those roles alone
+    "window": "#1a1a1a",
+    "base": "#2d2d2d",
+    "alternate_base": "#353535",
+    "button": "#353535",
+    "dark": "#1a1a1a",
+    "mid": "#232323",
+    "highlight": "#2d5c76",
+    "highlighted_text": "#ffffff",
+    "tooltip_base": "#353535",
+    "tooltip_text": "#ffffff",
+    "tooltip_border": "#2d5c76"
+}
+
+_LIGHT_COLORS = {
+    "background": "#ffffff",
+    "foreground": "#000000",
+    "primary": "#0066cc",
+    "secondary": "#308cc6",
+    "success": "#28a745",
+    "warning": "#ffc107",
+    "error": "#dc3545",
+    "border": "#e0e0e0",
+    # Stylesheet template values; dark and mid are the Qt-derived shades of
+    # button and only reach the QSS, the palette leaves those roles alone
+    "window": "#f5f5f5",
+    "base": "#ffffff",
+    "alternate_base": "#f7f7f7",
+    "button": "#e0e0e0",
+    "dark": "#707070",
+    "mid": "#959595",
+    "highlight": "#308cc6",
+    "highlighted_text": "#ffffff",
+    "tooltip_base": "#ffffff",
+    "tooltip_text": "#000000",
+    "tooltip_border": "#959595"
+}
+
+class ThemeColors(NamedTuple):
+    """Colours of one theme, read as attributes (colors.primary)."""
+    background: str
+    foreground: str
+    primary: str
+    secondary: str
+    success: str
+    warning: str
+    error: str
+    border: str
+    window: str
+    base: str
+    alternate_base: str
+    button: str
+    dark: str
+    mid: str
+    highlight: str
+    highlighted_text: str
+    tooltip_base: str
+    tooltip_text: str
+    tooltip_border: str
+
+_DARK_THEME = ThemeColors(**_DARK_COLORS)
+_LIGHT_THEME = ThemeColors(**_LIGHT_COLORS)
+
+@lru_cache(maxsize=2)
+def get_theme_colors(theme: str = "light") -> Mapping[str, str]:
+    """Get color palette for specified theme.
+    
+    The mapping is shared between callers and read-only.
     """
-    app.setStyleSheet(app.styleSheet() + additional_styles)
-
-def apply_light_stylesheet(app) -> None:
-    """Apply light theme specific styles."""
-    additional_styles = """
-        /* Light theme specific styles */
-        QWidget {
-            outline: none;
-        }
-        
-        QToolTip {
-            color: palette(tooltip-text);
-            background-color: palette(tooltip-base);
-            border: 1px solid palette(mid);
-        }
+    return MappingProxyType(_DARK_COLORS if theme == "dark" else _LIGHT_COLORS)
+
+def get_theme_color_tuple(theme: str = "light") -> ThemeColors:
+    """Get color palette for specified theme as attributes (colors.primary)."""
+    return _DARK_THEME if theme == "dark" else _LIGHT_THEME
+
+# QColor versions of the theme colours, built once per theme
+_THEME_QCOLORS: Dict[str, Dict[str, QColor]] = {}
+
+def get_theme_qcolors(theme: str = "light") -> Dict[str, QColor]:
+    """Get the theme colours as shared QColor instances.
+    
+    The returned colours are shared between callers and must not be modified.
     """
-    app.setStyleSheet(app.styleSheet() + additional_styles)
-
-def get_theme_colors(theme: str = "light") -> Dict[str, str]:
-    """Get color palette for specified theme."""
-    if theme == "dark":
-        return {
-            "background": "#1a1a1a",
-            "foreground": "#ffffff",
-            "primary": "#3d8ec9",
-            "secondary": "#2d5c76",
-            "success": "#28a745",
-            "warning": "#ffc107",
-            "error": "#dc3545",
-            "border": "#353535"
-        }
-    else:
-        return {
-            "background": "#ffffff",
-            "foreground": "#000000",
-            "primary": "#0066cc",
-            "secondary": "#308cc6",
-            "success": "#28a745",
-            "warning": "#ffc107",
-            "error": "#dc3545",
-            "border": "#e0e0e0"
-        }
\ No newline at end of file
+    colors = _THEME_QCOLORS.get(theme)
+    if colors is None:
+        colors = {name: QColor.fromRgb(int(value[1:], 16))
+                  for name, value in get_theme_colors(theme).items()
+                  if value.startswith("#")}
+        _THEME_QCOLORS[theme] = colors
+    return colors